@@ -1,3 +1,5 @@
 """Excel CLI Toolkit - Command-line toolkit for Excel data manipulation. """
 
-__version__ = "0.2.0"
+from excel_toolkit._version import __version__
+
+__all__ = ["__version__"]
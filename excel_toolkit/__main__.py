@@ -1,6 +1,6 @@
 """Entry point for python -m excel_toolkit."""
 
-from excel_toolkit.cli import app
+from excel_toolkit.cli import main
 
 if __name__ == "__main__":
-    app()
+    main()
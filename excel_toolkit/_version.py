@@ -0,0 +1,8 @@
+"""Version information for Excel Toolkit.
+
+This is the single source of truth for the package version. Hatch reads it
+at build time (see ``[tool.hatch.version]`` in pyproject.toml), so the CLI
+never needs ``importlib.metadata`` to report its version.
+"""
+
+__version__ = "0.3.0"
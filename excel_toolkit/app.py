@@ -0,0 +1,93 @@
+"""Typer application for Excel Toolkit.
+
+Built on demand by :mod:`excel_toolkit.cli` for any invocation its root
+dispatcher does not answer directly.
+"""
+
+import sys
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+from typer.main import get_command_from_info
+from typer.models import CommandInfo
+
+from excel_toolkit import commands
+from excel_toolkit.cli import sysinfo_text, version_text
+
+# Configure warnings first (before importing other modules)
+from excel_toolkit.warnings_config import *  # noqa: F401, F403
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports subcommand modules on first use.
+
+    Commands registered directly on the app (version, sysinfo) behave as
+    usual. Every name in commands.COMMAND_NAMES is resolved through the lazy
+    ``excel_toolkit.commands`` namespace the first time Click asks for it, so
+    a subcommand's module (and pandas) is only imported when it is needed.
+    """
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        """List eagerly registered commands followed by lazy ones."""
+        return super().list_commands(ctx) + [
+            name for name in commands.COMMAND_NAMES if name not in self.commands
+        ]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> TyperCommand | None:
+        """Return a command, importing its module if it has not been loaded yet."""
+        if cmd_name not in self.commands and cmd_name in commands.COMMAND_NAMES:
+            self.commands[cmd_name] = self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> TyperCommand:
+        """Import a subcommand function and convert it to a Click command."""
+        return get_command_from_info(
+            CommandInfo(name=cmd_name, callback=getattr(commands, cmd_name)),
+            pretty_exceptions_short=app.pretty_exceptions_short,
+            rich_markup_mode=app.rich_markup_mode,
+        )
+
+
+# Rich help panels and tracebacks only pay off on a terminal; when output is
+# piped or captured, plain Click formatting avoids importing rich at all.
+_interactive = sys.stdout.isatty()
+
+app = typer.Typer(
+    cls=LazyTyperGroup,
+    help="Excel CLI Toolkit - Command-line toolkit for Excel data manipulation and analysis",
+    rich_markup_mode="rich" if _interactive else None,
+    pretty_exceptions_enable=_interactive,
+)
+
+
+def _show_version(value: bool) -> None:
+    """Print the version and stop before any subcommand is resolved."""
+    if value:
+        typer.echo(version_text())
+        raise typer.Exit()
+
+
+@app.callback()
+def root(
+    show_version: bool = typer.Option(
+        False,
+        "--version",
+        "-V",
+        callback=_show_version,
+        is_eager=True,
+        help="Show version and exit",
+    ),
+) -> None:
+    """Handle options that apply before any subcommand."""
+
+
+@app.command()
+def version():
+    """Show version information."""
+    typer.echo(version_text())
+
+
+@app.command()
+def sysinfo():
+    """Show system information."""
+    typer.echo(sysinfo_text())
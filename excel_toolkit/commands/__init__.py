@@ -2,101 +2,84 @@
 
 This module contains all CLI commands for the toolkit.
 Each command is a separate module that can be imported and tested.
+
+Command functions and their per-command Typer apps are resolved lazily
+(PEP 562), so ``from excel_toolkit.commands import head`` only imports
+the ``head`` module rather than every command.
 """
 
-# Command imports
-from excel_toolkit.commands.append import app as append_app
-from excel_toolkit.commands.append import append
-from excel_toolkit.commands.clean import app as clean_app
-from excel_toolkit.commands.clean import clean
-from excel_toolkit.commands.convert import app as convert_app
-from excel_toolkit.commands.convert import convert
-from excel_toolkit.commands.count import app as count_app
-from excel_toolkit.commands.count import count
-from excel_toolkit.commands.dedupe import app as dedupe_app
-from excel_toolkit.commands.dedupe import dedupe
-from excel_toolkit.commands.export import app as export_app
-from excel_toolkit.commands.export import export
-from excel_toolkit.commands.fill import app as fill_app
-from excel_toolkit.commands.fill import fill
-from excel_toolkit.commands.filter import app as filter_app
-from excel_toolkit.commands.filter import filter
-from excel_toolkit.commands.group import app as group_app
-from excel_toolkit.commands.group import group
-from excel_toolkit.commands.head import app as head_app
-from excel_toolkit.commands.head import head
-from excel_toolkit.commands.info import app as info_app
-from excel_toolkit.commands.info import info
-from excel_toolkit.commands.join import app as join_app
-from excel_toolkit.commands.join import join
-from excel_toolkit.commands.merge import app as merge_app
-from excel_toolkit.commands.merge import merge
-from excel_toolkit.commands.rename import app as rename_app
-from excel_toolkit.commands.rename import rename
-from excel_toolkit.commands.search import app as search_app
-from excel_toolkit.commands.search import search
-from excel_toolkit.commands.select import app as select_app
-from excel_toolkit.commands.select import select
-from excel_toolkit.commands.sort import app as sort_app
-from excel_toolkit.commands.sort import sort
-from excel_toolkit.commands.stats import app as stats_app
-from excel_toolkit.commands.stats import stats
-from excel_toolkit.commands.strip import app as strip_app
-from excel_toolkit.commands.strip import strip
-from excel_toolkit.commands.tail import app as tail_app
-from excel_toolkit.commands.tail import tail
-from excel_toolkit.commands.transform import app as transform_app
-from excel_toolkit.commands.transform import transform
-from excel_toolkit.commands.unique import app as unique_app
-from excel_toolkit.commands.unique import unique
-from excel_toolkit.commands.validate import app as validate_app
-from excel_toolkit.commands.validate import validate
-
-__all__ = [
+import importlib
+import sys
+import types
+from typing import Any
+
+# Command modules, in CLI help order. Each is exported as ``<name>`` (the
+# command function) and ``<name>_app`` (its standalone Typer app).
+COMMAND_NAMES = (
     "info",
-    "info_app",
     "head",
-    "head_app",
     "filter",
-    "filter_app",
     "sort",
-    "sort_app",
     "stats",
-    "stats_app",
     "validate",
-    "validate_app",
     "clean",
-    "clean_app",
     "select",
-    "select_app",
     "dedupe",
-    "dedupe_app",
     "fill",
-    "fill_app",
     "group",
-    "group_app",
     "unique",
-    "unique_app",
     "transform",
-    "transform_app",
     "rename",
-    "rename_app",
     "search",
-    "search_app",
     "convert",
-    "convert_app",
     "merge",
-    "merge_app",
     "join",
-    "join_app",
     "tail",
-    "tail_app",
     "count",
-    "count_app",
     "append",
-    "append_app",
     "strip",
-    "strip_app",
     "export",
-    "export_app",
+    "extract",
+    "calculate",
+    "pivot",
+    "aggregate",
+    "compare",
+)
+
+__all__ = ["COMMAND_NAMES"] + [
+    name for module in COMMAND_NAMES for name in (module, f"{module}_app")
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the command module backing ``name`` on first access."""
+    module_name, is_app = (name[: -len("_app")], True) if name.endswith("_app") else (name, False)
+    if module_name not in COMMAND_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = module.app if is_app else getattr(module, module_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List exported names, including command attributes not yet imported."""
+    return sorted(set(globals()) | set(__all__))
+
+
+class _CommandsModule(types.ModuleType):
+    """Package module that keeps command names bound to command functions.
+
+    Importing ``excel_toolkit.commands.info`` makes the import system set the
+    ``info`` attribute on this package to the submodule, which would shadow the
+    lazily exported ``info`` command function.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in COMMAND_NAMES and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _CommandsModule
@@ -5,18 +5,6 @@ Perform custom aggregations on grouped data.
 
 import typer
 
-from excel_toolkit.commands.common import (
-    read_data_file,
-    write_or_display,
-)
-from excel_toolkit.core import HandlerFactory
-from excel_toolkit.fp import is_err, unwrap, unwrap_err
-from excel_toolkit.operations.aggregating import (
-    aggregate_groups,
-    parse_aggregation_specs,
-    validate_aggregation_columns,
-)
-
 
 def aggregate(
     file_path: str = typer.Argument(..., help="Path to input file"),
@@ -41,6 +29,20 @@ def aggregate(
         xl aggregate data.csv --group "Category" --functions "Sales:sum,Sales:min,Sales:max,Profit:mean" --output stats.xlsx
         xl aggregate transactions.xlsx --group "Date,Type" --functions "Amount:sum,Amount:count,Quantity:mean" --output daily.xlsx
     """
+    from excel_toolkit.commands.common import (
+        display_table,
+        parse_column_list,
+        read_data_file,
+        unwrap_or_exit,
+        write_or_display,
+    )
+    from excel_toolkit.core import get_handler_factory
+    from excel_toolkit.operations.aggregating import (
+        aggregate_groups,
+        parse_aggregation_specs,
+        validate_aggregation_columns,
+    )
+
     # 1. Validate parameters
     if not group:
         typer.echo("Error: Must specify --group columns", err=True)
@@ -58,55 +60,51 @@ def aggregate(
     df = read_data_file(file_path, sheet)
 
     # 3. Parse aggregation specifications
-    parse_result = parse_aggregation_specs(functions)
-    if is_err(parse_result):
-        error = unwrap_err(parse_result)
-        typer.echo(f"Error parsing aggregation specifications: {error}", err=True)
-        raise typer.Exit(1)
-
-    agg_specs = unwrap(parse_result)
+    agg_specs = unwrap_or_exit(
+        parse_aggregation_specs(functions), "Error parsing aggregation specifications"
+    )
 
     # 4. Parse group columns
-    group_cols = [c.strip() for c in group.split(",")]
+    group_cols = parse_column_list(group)
 
     # 5. Validate columns
-    validation = validate_aggregation_columns(df, group_cols, list(agg_specs.keys()))
-    if is_err(validation):
-        error = unwrap_err(validation)
-        typer.echo(f"Error: {error}", err=True)
-        raise typer.Exit(1)
+    unwrap_or_exit(validate_aggregation_columns(df, group_cols, list(agg_specs.keys())), "Error")
 
     # 6. Aggregate
-    result = aggregate_groups(df, group_cols, agg_specs)
-    if is_err(result):
-        error = unwrap_err(result)
-        typer.echo(f"Error aggregating data: {error}", err=True)
-        raise typer.Exit(1)
-
-    df_agg = unwrap(result)
+    df_agg = unwrap_or_exit(aggregate_groups(df, group_cols, agg_specs), "Error aggregating data")
 
     # 7. Handle dry-run
     if dry_run:
-        typer.echo(f"Would aggregate {len(df)} rows into {len(df_agg)} groups")
-        typer.echo(f"Group by: {group}")
-        typer.echo(f"Aggregations: {functions}")
-        typer.echo("")
+        typer.echo(
+            "\n".join(
+                (
+                    f"Would aggregate {len(df)} rows into {len(df_agg)} groups",
+                    f"Group by: {group}",
+                    f"Aggregations: {functions}",
+                    "",
+                )
+            )
+        )
         if len(df_agg) > 0:
-            from excel_toolkit.commands.common import display_table
-
             preview_rows = min(5, len(df_agg))
             typer.echo("Preview of aggregated data:")
             display_table(df_agg.head(preview_rows))
         raise typer.Exit(0)
 
     # 8. Display summary
-    typer.echo(f"Aggregated {len(df)} rows into {len(df_agg)} groups")
-    typer.echo(f"Group by: {group}")
-    typer.echo(f"Aggregations: {functions}")
-    typer.echo("")
+    typer.echo(
+        "\n".join(
+            (
+                f"Aggregated {len(df)} rows into {len(df_agg)} groups",
+                f"Group by: {group}",
+                f"Aggregations: {functions}",
+                "",
+            )
+        )
+    )
 
     # 9. Write or display
-    factory = HandlerFactory()
+    factory = get_handler_factory()
     write_or_display(df_agg, factory, output, "table")
 
 
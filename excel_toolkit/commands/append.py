@@ -5,16 +5,8 @@ Concatenate multiple datasets vertically by adding rows.
 
 from pathlib import Path
 
-import pandas as pd
 import typer
 
-from excel_toolkit.commands.common import (
-    display_table,
-    read_data_file,
-    write_or_display,
-)
-from excel_toolkit.core import HandlerFactory
-
 
 def append(
     main_file: str = typer.Argument(..., help="Path to main input file"),
@@ -37,6 +29,17 @@ def append(
         xl append main.csv extra.csv --ignore-index --output combined.csv
         xl append main.xlsx additional.xlsx --sort --output sorted.xlsx
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import pandas as pd
+
+    from excel_toolkit.commands.common import (
+        display_table,
+        read_data_file,
+        write_or_display,
+    )
+    from excel_toolkit.core import get_handler_factory
+
     # 1. Read main file
     main_df = read_data_file(main_file, sheet)
 
@@ -49,33 +52,44 @@ def append(
     dfs = [main_df]
     total_main_rows = len(main_df)
 
-    for i, file_path in enumerate(additional_files):
-        # Determine sheet name for this file
-        file_sheet = None
-        if additional_sheets and i < len(additional_sheets):
-            file_sheet = additional_sheets[i]
+    # Determine sheet name for each file
+    file_sheets = [
+        additional_sheets[i] if additional_sheets and i < len(additional_sheets) else None
+        for i in range(len(additional_files))
+    ]
 
-        # Read file using helper
-        file_df = read_data_file(str(file_path), file_sheet)
+    # Reads are independent, so overlap their I/O; map() keeps input order
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(additional_files)))) as executor:
+        file_dfs = list(executor.map(read_data_file, map(str, additional_files), file_sheets))
 
+    main_cols = main_df.columns
+    for file_path, file_df in zip(additional_files, file_dfs):
         # Check column compatibility
         if not file_df.empty:
-            if list(file_df.columns) != list(main_df.columns):
-                typer.echo(f"Warning: Column mismatch in {Path(file_path).name}", err=True)
-                typer.echo(f"  Expected: {', '.join(main_df.columns)}", err=True)
-                typer.echo(f"  Found: {', '.join(file_df.columns)}", err=True)
-                typer.echo("  Attempting to align columns...", err=True)
-
-                # Align columns
-                file_df = file_df.reindex(columns=main_df.columns)
+            if not file_df.columns.equals(main_cols):
+                typer.echo(
+                    "\n".join(
+                        (
+                            f"Warning: Column mismatch in {Path(file_path).name}",
+                            f"  Expected: {', '.join(main_cols)}",
+                            f"  Found: {', '.join(file_df.columns)}",
+                            "  Attempting to align columns...",
+                        )
+                    ),
+                    err=True,
+                )
+
+                # Align columns: only reindex (NaN-filling) when columns are missing;
+                # extra or reordered columns just need a column selection
+                if main_cols.difference(file_df.columns).empty:
+                    file_df = file_df[main_cols]
+                else:
+                    file_df = file_df.reindex(columns=main_cols)
 
             dfs.append(file_df)
 
     # 4. Concatenate all DataFrames
-    if ignore_index:
-        result_df = pd.concat(dfs, ignore_index=True)
-    else:
-        result_df = pd.concat(dfs)
+    result_df = pd.concat(dfs, ignore_index=ignore_index)
 
     total_rows = len(result_df)
     appended_rows = total_rows - total_main_rows
@@ -83,18 +97,23 @@ def append(
     # 5. Sort if requested
     if sort:
         first_col = result_df.columns[0]
-        result_df = result_df.sort_values(by=first_col)
-        result_df = result_df.reset_index(drop=True)
+        result_df = result_df.sort_values(by=first_col, kind="stable", ignore_index=True)
 
     # 6. Display summary
-    typer.echo(f"Main file rows: {total_main_rows}")
-    typer.echo(f"Appended rows: {appended_rows}")
-    typer.echo(f"Total rows: {total_rows}")
-    typer.echo(f"Files processed: {len(dfs)}")
-    typer.echo("")
+    typer.echo(
+        "\n".join(
+            (
+                f"Main file rows: {total_main_rows}",
+                f"Appended rows: {appended_rows}",
+                f"Total rows: {total_rows}",
+                f"Files processed: {len(dfs)}",
+                "",
+            )
+        )
+    )
 
     # 7. Write or display
-    factory = HandlerFactory()
+    factory = get_handler_factory()
     if output:
         write_or_display(result_df, factory, output, "table")
     else:
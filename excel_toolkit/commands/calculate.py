@@ -3,17 +3,8 @@
 Perform calculations on columns (cumulative, growth, etc.).
 """
 
-import pandas as pd
 import typer
 
-from excel_toolkit.commands.common import (
-    display_table,
-    read_data_file,
-    resolve_column_reference,
-    write_or_display,
-)
-from excel_toolkit.core import HandlerFactory
-
 
 def calculate(
     file_path: str = typer.Argument(..., help="Path to input file"),
@@ -46,6 +37,17 @@ def calculate(
         xl calculate sales.xlsx --column "Revenue" --operation growth_pct
         xl calculate data.csv -c "Price" -op diff -o calculated.xlsx
     """
+    import numpy as np
+    from pandas.api.types import is_numeric_dtype
+
+    from excel_toolkit.commands.common import (
+        display_table,
+        read_data_file,
+        resolve_column_reference,
+        write_or_display,
+    )
+    from excel_toolkit.core import get_handler_factory
+
     # 1. Validate operation
     valid_operations = ["cumsum", "cummean", "growth", "growth_pct", "diff"]
     if operation not in valid_operations:
@@ -65,34 +67,46 @@ def calculate(
 
     # 4. Resolve column reference (supports both name and index)
     resolved_column = resolve_column_reference(column, df)
+    col_series = df[resolved_column]
 
     # 5. Validate column is numeric
-    if not pd.api.types.is_numeric_dtype(df[resolved_column]):
+    if not is_numeric_dtype(col_series):
         typer.echo(f"Error: Column '{resolved_column}' is not numeric", err=True)
-        typer.echo(f"Column type: {df[resolved_column].dtype}")
+        typer.echo(f"Column type: {col_series.dtype}")
         raise typer.Exit(1)
 
     # 6. Perform calculation
     result_col_name = f"{resolved_column}_{operation}"
 
     if operation == "cumsum":
-        df[result_col_name] = df[resolved_column].cumsum()
+        df[result_col_name] = col_series.cumsum()
     elif operation == "cummean":
-        df[result_col_name] = df[resolved_column].expanding().mean()
-    elif operation == "growth":
-        df[result_col_name] = df[resolved_column].diff()
+        # Running sum over running count of non-null values; matches
+        # expanding().mean() without pandas' windowing machinery
+        values = col_series.to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(values)
+        running_sum = np.cumsum(np.where(valid, values, 0.0))
+        running_count = np.cumsum(valid)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            df[result_col_name] = running_sum / running_count
+    elif operation in ("growth", "diff"):
+        df[result_col_name] = col_series.diff()
     elif operation == "growth_pct":
-        df[result_col_name] = df[resolved_column].pct_change() * 100
-    elif operation == "diff":
-        df[result_col_name] = df[resolved_column].diff()
+        df[result_col_name] = col_series.pct_change() * 100
 
     # 7. Display summary
-    typer.echo(f"Calculated {operation} on '{resolved_column}'")
-    typer.echo(f"Rows: {original_count}")
-    typer.echo(f"Original columns: {original_cols}")
-    typer.echo(f"New columns: {original_cols + 1}")
-    typer.echo(f"Result column: {result_col_name}")
-    typer.echo("")
+    typer.echo(
+        "\n".join(
+            (
+                f"Calculated {operation} on '{resolved_column}'",
+                f"Rows: {original_count}",
+                f"Original columns: {original_cols}",
+                f"New columns: {original_cols + 1}",
+                f"Result column: {result_col_name}",
+                "",
+            )
+        )
+    )
 
     # 8. Handle dry-run mode
     if dry_run:
@@ -103,7 +117,7 @@ def calculate(
         raise typer.Exit(0)
 
     # 9. Write or display
-    factory = HandlerFactory()
+    factory = get_handler_factory()
     write_or_display(df, factory, output, "table")
 
 
@@ -3,16 +3,21 @@
 Cleans data by removing whitespace, standardizing case, and fixing formatting issues.
 """
 
+import re
+from collections.abc import Callable
+from functools import partial
+
 import pandas as pd
 import typer
+from pandas.api.types import is_object_dtype
 
 from excel_toolkit.commands.common import (
     display_table,
     read_data_file,
+    unwrap_or_exit,
     write_or_display,
 )
-from excel_toolkit.core import HandlerFactory
-from excel_toolkit.fp import is_err, unwrap, unwrap_err
+from excel_toolkit.core import get_handler_factory
 from excel_toolkit.operations.cleaning import trim_whitespace
 
 
@@ -118,8 +123,8 @@ def clean(
             typer.echo(f"Available columns: {', '.join(df.columns)}")
             raise typer.Exit(1)
     else:
-        # Clean all string columns
-        column_list = [col for col in df.columns if df[col].dtype == "object"]
+        # Clean all string columns (object or pandas string dtype)
+        column_list = df.select_dtypes(include=["object", "string"]).columns.tolist()
 
     if not column_list:
         typer.echo("No string columns to clean")
@@ -127,48 +132,34 @@ def clean(
         raise typer.Exit(0)
 
     # 5. Apply cleaning operations
-    df_cleaned = df.copy()
+    # The frame was read for this command alone, so columns are replaced in
+    # place rather than on a defensive copy
+    df_cleaned = df
 
     # Use trim_whitespace operation if --trim specified
     if trim:
-        result = trim_whitespace(df_cleaned, columns=column_list, side="both")
-        if is_err(result):
-            error = unwrap_err(result)
-            typer.echo(f"Error trimming whitespace: {error}", err=True)
-            raise typer.Exit(1)
-        df_cleaned = unwrap(result)
+        df_cleaned = unwrap_or_exit(
+            trim_whitespace(df_cleaned, columns=column_list, side="both"),
+            "Error trimming whitespace",
+        )
 
-    # Apply other operations
+    # Apply other operations as one per-value pipeline, so each column is
+    # walked once instead of once per operation
+    pipeline = _build_pipeline(operations)
+    string_columns = set(df_cleaned.select_dtypes(include=["object", "string"]).columns)
     for col in column_list:
-        # Only clean string columns
-        if df_cleaned[col].dtype != "object":
+        # Only clean string columns, and only if something beyond trim was requested
+        if not pipeline or col not in string_columns:
             continue
 
-        series = df_cleaned[col].copy()
-
-        # Apply operations in order
-        if whitespace:
-            series = _normalize_whitespace(series)
-
-        if lowercase:
-            series = _apply_case(series, "lower")
-
-        if uppercase:
-            series = _apply_case(series, "upper")
+        series = df_cleaned[col]
+        # Object columns are stringified as before; string-dtype columns
+        # already hold str values and keep their missing values as-is
+        if is_object_dtype(series):
+            series = series.astype(str)
 
-        if titlecase:
-            series = _apply_case(series, "title")
-
-        if casefold:
-            series = _apply_case(series, "casefold")
-
-        if remove_special:
-            series = _remove_special_chars(series)
-
-        if keep_alphanumeric:
-            series = _keep_alphanumeric(series)
-
-        df_cleaned[col] = series
+        cleaned = _apply_pipeline(series.tolist(), pipeline)
+        df_cleaned[col] = pd.array(cleaned, dtype=series.dtype)
 
     # 6. Display summary
     typer.echo(f"Cleaned {len(column_list)} column(s)")
@@ -186,45 +177,78 @@ def clean(
         raise typer.Exit(0)
 
     # 8. Write or display
-    factory = HandlerFactory()
+    factory = get_handler_factory()
     write_or_display(df_cleaned, factory, output, "table")
 
 
-def _trim_whitespace(series: pd.Series) -> pd.Series:
-    """Remove leading and trailing whitespace from string values."""
-    # Convert to string and strip whitespace
-    return series.astype(str).str.strip()
+# Multiple whitespace characters, collapsed to a single space
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+# Anything but alphanumeric, spaces, and basic punctuation (. , - _ @)
+_SPECIAL_CHARS = re.compile(r"[^\w\s\.\,\-\_@]")
 
+# Anything but letters and numbers
+_NON_ALPHANUMERIC = re.compile(r"[^a-zA-Z0-9]")
 
-def _normalize_whitespace(series: pd.Series) -> pd.Series:
-    """Normalize multiple whitespace characters to single space."""
-    # Replace multiple whitespace characters with single space
-    return series.astype(str).str.replace(r"\s+", " ", regex=True)
+# The same set as bytes, for the ASCII fast path in _keep_alphanumeric
+_NON_ALPHANUMERIC_BYTES = bytes(c for c in range(128) if not chr(c).isalnum())
 
+# Case operations map straight onto str methods
+_CASE_METHODS: dict[str, Callable[[str], str]] = {
+    "lowercase": str.lower,
+    "uppercase": str.upper,
+    "titlecase": str.title,
+    "casefold": str.casefold,
+}
 
-def _apply_case(series: pd.Series, case_type: str) -> pd.Series:
-    """Apply case transformation to string values."""
-    if case_type == "lower":
-        return series.astype(str).str.lower()
-    elif case_type == "upper":
-        return series.astype(str).str.upper()
-    elif case_type == "title":
-        return series.astype(str).str.title()
-    elif case_type == "casefold":
-        return series.astype(str).str.casefold()
-    return series
 
+def _build_pipeline(operations: list[str]) -> list[Callable[[str], str]]:
+    """Build the per-value cleaning steps for every operation except trim.
+
+    Case mappings never create or remove whitespace, so whitespace
+    normalization can run after them; it is dropped entirely when
+    --keep-alphanumeric removes all whitespace anyway.
+    """
+    pipeline = [_CASE_METHODS[op] for op in operations if op in _CASE_METHODS]
+
+    if "whitespace" in operations and "keep_alphanumeric" not in operations:
+        pipeline.append(partial(_WHITESPACE_RUN.sub, " "))
+
+    if "remove_special" in operations:
+        pipeline.append(partial(_SPECIAL_CHARS.sub, ""))
+
+    if "keep_alphanumeric" in operations:
+        pipeline.append(_keep_alphanumeric)
+
+    return pipeline
 
-def _remove_special_chars(series: pd.Series) -> pd.Series:
-    """Remove special characters, keeping only letters, numbers, and basic punctuation."""
-    # Keep alphanumeric, spaces, and basic punctuation (. , - _ @)
-    return series.astype(str).str.replace(r"[^\w\s\.\,\-\_@]", "", regex=True)
 
+def _keep_alphanumeric(value: str) -> str:
+    """Remove everything except ASCII letters and numbers.
 
-def _keep_alphanumeric(series: pd.Series) -> pd.Series:
-    """Keep only alphanumeric characters (letters and numbers)."""
-    # Remove everything except letters and numbers
-    return series.astype(str).str.replace(r"[^a-zA-Z0-9]", "", regex=True)
+    ASCII values go through bytes.translate, a plain table lookup per byte
+    that is several times faster than the regex substitution.
+    """
+    if value.isascii():
+        return value.encode("ascii").translate(None, _NON_ALPHANUMERIC_BYTES).decode("ascii")
+    return _NON_ALPHANUMERIC.sub("", value)
+
+
+def _apply_pipeline(values: list, pipeline: list[Callable[[str], str]]) -> list:
+    """Run the cleaning pipeline over the str values of a column.
+
+    Each step is mapped over the whole column in turn, which keeps the
+    per-value loop inside map() rather than in interpreted bytecode.
+    Non-str values (missing values in string-dtype columns) are left as-is.
+    """
+    strings = [value for value in values if isinstance(value, str)]
+    for step in pipeline:
+        strings = list(map(step, strings))
+
+    if len(strings) == len(values):
+        return strings
+    cleaned = iter(strings)
+    return [next(cleaned) if isinstance(value, str) else value for value in values]
 
 
 # Create CLI app for this command
@@ -5,15 +5,40 @@ across different commands.
 """
 
 import json
+import re
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import pandas as pd
 import typer
+from pandas.api.types import is_object_dtype, is_string_dtype
 from tabulate import tabulate
 
-from excel_toolkit.core import CSVHandler, ExcelHandler, HandlerFactory
-from excel_toolkit.fp import is_err, is_ok, unwrap, unwrap_err
+from excel_toolkit.core import CSVHandler, ExcelHandler, HandlerFactory, get_handler_factory
+from excel_toolkit.fp import Result, is_err, is_ok, unwrap, unwrap_err
+
+T = TypeVar("T")
+
+# Separator for comma-separated column lists, absorbing surrounding whitespace
+_COLUMN_SEPARATOR = re.compile(r"\s*,\s*")
+
+# User-facing message prefixes, keyed by the error type name they apply to
+_ERROR_PREFIXES = {
+    "ColumnNotFoundError": "Error",
+    "TypeMismatchError": "Type mismatch",
+    "ValueOutOfRangeError": "Value out of range",
+    "InvalidConditionError": "Invalid condition",
+    "FilteringError": "Filter error",
+    "SortingError": "Sort error",
+    "PivotingError": "Pivot error",
+    "AggregatingError": "Aggregation error",
+    "ComparingError": "Comparison error",
+    "CleaningError": "Cleaning error",
+    "TransformingError": "Transform error",
+    "JoiningError": "Join error",
+    "ValidationError": "Validation error",
+}
 
 
 def display_table(
@@ -38,15 +63,11 @@ def display_table(
     if max_columns is not None and len(df.columns) > max_columns:
         df = df.iloc[:, :max_columns]
 
-    # Truncate long values
-    df_truncated = df.copy()
-    for col in df_truncated.columns:
-        df_truncated[col] = df_truncated[col].apply(
-            lambda x: _truncate_value(x, max_col_width) if pd.notna(x) else x
-        )
+    # Truncate long values column by column, without copying the frame
+    columns = [_truncate_column(series, max_col_width) for _, series in df.items()]
 
     # Convert to list format for tabulate
-    table_data = [df_truncated.columns.tolist()] + df_truncated.values.tolist()
+    table_data = [df.columns.tolist(), *zip(*columns)]
 
     # Display with tabulate
     print(tabulate(table_data, headers="firstrow", tablefmt="grid"))
@@ -68,8 +89,6 @@ def display_json(df: pd.DataFrame, indent: int = 2) -> None:
         df: DataFrame to display
         indent: JSON indentation spaces
     """
-    # Convert DataFrame to dict records
-    records = df.to_dict(orient="records")
 
     # Handle NaN values (convert to None)
     def clean_nan(obj: Any) -> Any:
@@ -78,10 +97,13 @@ def display_json(df: pd.DataFrame, indent: int = 2) -> None:
                 return None
         return obj
 
-    records_cleaned = [{k: clean_nan(v) for k, v in record.items()} for record in records]
+    # Convert DataFrame to dict records, cleaning values as they are built
+    records = [
+        {k: clean_nan(v) for k, v in record.items()} for record in df.to_dict(orient="records")
+    ]
 
     # Print JSON
-    print(json.dumps(records_cleaned, indent=indent, default=str))
+    print(json.dumps(records, indent=indent, default=str))
 
 
 def display_column_types(df: pd.DataFrame) -> None:
@@ -121,12 +143,41 @@ def _truncate_value(value: Any, max_width: int) -> str:
     Returns:
         Truncated string representation
     """
-    str_val = str(value)
+    # Most preview cells are already strings; skip the conversion for them
+    str_val = value if isinstance(value, str) else f"{value}"
     if len(str_val) > max_width:
         return str_val[: max_width - 3] + "..."
     return str_val
 
 
+def _truncate_column(series: pd.Series, max_width: int) -> pd.Series:
+    """Truncate every value of a column, leaving missing values as-is.
+
+    Object and string columns are truncated with vectorized string
+    operations, where astype(str) matches str() per value; other dtypes
+    (dates in particular) format differently when cast, so they go through
+    _truncate_value cell by cell.
+
+    Args:
+        series: Column to truncate
+        max_width: Maximum width
+
+    Returns:
+        Column of truncated string representations
+    """
+    if not (is_object_dtype(series) or is_string_dtype(series)):
+        # Find missing values once for the column, not with pd.notna per cell
+        values = series.to_numpy(dtype=object)
+        present = series.notna().to_numpy()
+        values[present] = [_truncate_value(x, max_width) for x in values[present]]
+        return pd.Series(values, index=series.index, dtype=object)
+
+    text = series.astype(str)
+    too_long = text.str.len() > max_width
+    text = text.where(~too_long, text.str.slice(0, max_width - 3) + "...")
+    return text.where(series.notna(), series)
+
+
 def format_file_info(
     path: str, sheet: str | None = None, total_rows: int = 0, total_cols: int = 0
 ) -> str:
@@ -141,8 +192,6 @@ def format_file_info(
     Returns:
         Formatted information string
     """
-    from pathlib import Path
-
     path_obj = Path(path)
     lines = [f"File: {path_obj.name}"]
 
@@ -186,7 +235,7 @@ def read_data_file(
         typer.echo(f"File not found: {file_path}", err=True)
         raise typer.Exit(1)
 
-    factory = HandlerFactory()
+    factory = get_handler_factory()
 
     # Get appropriate handler
     handler_result = factory.get_handler(path)
@@ -202,13 +251,9 @@ def read_data_file(
         kwargs = {"sheet_name": sheet} if sheet else {}
         read_result = handler.read(path, **kwargs)
     elif isinstance(handler, CSVHandler):
-        # Auto-detect encoding
-        encoding_result = handler.detect_encoding(path)
-        encoding = unwrap(encoding_result) if is_ok(encoding_result) else "utf-8"
-
-        # Auto-detect delimiter
-        delimiter_result = handler.detect_delimiter(path, encoding)
-        delimiter = unwrap(delimiter_result) if is_ok(delimiter_result) else ","
+        # Auto-detect encoding and delimiter from one sample of the file
+        format_result = handler.detect_format(path)
+        encoding, delimiter = unwrap(format_result) if is_ok(format_result) else ("utf-8", ",")
 
         read_result = handler.read(path, encoding=encoding, delimiter=delimiter)
     else:
@@ -267,6 +312,41 @@ def write_or_display(
             raise typer.Exit(1)
 
 
+def parse_column_list(spec: str) -> list[str]:
+    """Parse a comma-separated list of column references.
+
+    Whitespace around names is stripped, empty entries are dropped and
+    duplicates are removed while keeping first-seen order.
+
+    Args:
+        spec: Comma-separated column references (e.g. "Region, Date")
+
+    Returns:
+        List of column references
+    """
+    return list(dict.fromkeys(filter(None, _COLUMN_SEPARATOR.split(spec.strip()))))
+
+
+def require_column_list(spec: str, option: str) -> list[str]:
+    """Parse a comma-separated column option that must name at least one column.
+
+    Args:
+        spec: Comma-separated column references (e.g. "Region, Date")
+        option: Option name shown in the error message (e.g. "--columns")
+
+    Returns:
+        Non-empty list of column references
+
+    Raises:
+        typer.Exit: If the spec names no columns (exits with code 1)
+    """
+    columns = parse_column_list(spec)
+    if not columns:
+        typer.echo(f"Error: {option} must name at least one column", err=True)
+        raise typer.Exit(1)
+    return columns
+
+
 def resolve_column_reference(
     col_ref: str,
     df: pd.DataFrame,
@@ -289,6 +369,23 @@ def resolve_column_reference(
         typer.Exit: If column reference is invalid
     """
     columns = df.columns.tolist()
+    return _resolve_column(col_ref, columns, set(columns))
+
+
+def _resolve_column(col_ref: str, columns: list, column_set: set) -> str:
+    """Resolve one column reference against precomputed column lookups.
+
+    Args:
+        col_ref: Column reference (name or index)
+        columns: Column names in order
+        column_set: The same names as a set, for constant-time membership
+
+    Returns:
+        Resolved column name
+
+    Raises:
+        typer.Exit: If column reference is invalid
+    """
     num_cols = len(columns)
 
     # Try to parse as integer index
@@ -317,7 +414,7 @@ def resolve_column_reference(
 
     except ValueError:
         # Not an integer, treat as column name
-        if col_ref not in columns:
+        if col_ref not in column_set:
             available = ", ".join(columns[:10])
             if num_cols > 10:
                 available += f", ... ({num_cols} total)"
@@ -343,7 +440,48 @@ def resolve_column_references(
     Raises:
         typer.Exit: If any column reference is invalid
     """
-    return [resolve_column_reference(ref, df) for ref in col_refs]
+    # Build the column lookups once for every reference
+    columns = df.columns.tolist()
+    column_set = set(columns)
+    return [_resolve_column(ref, columns, column_set) for ref in col_refs]
+
+
+def unwrap_or_exit(result: Result[T, Any], message: str) -> T:
+    """Return the value of an Ok result, or report the error and exit.
+
+    Collapses the is_err/unwrap_err/unwrap sequence commands use after
+    every operation into a single call.
+
+    Args:
+        result: Result returned by an operation
+        message: Prefix for the error line (e.g. "Error aggregating data")
+
+    Returns:
+        The value if result is Ok
+
+    Raises:
+        typer.Exit: If result is Err (exits with code 1)
+    """
+    if is_ok(result):
+        return unwrap(result)
+    typer.echo(f"{message}: {unwrap_err(result)}", err=True)
+    raise typer.Exit(1)
+
+
+@cache
+def _error_prefix(error_type: str) -> str:
+    """Return the message prefix for an error type name.
+
+    Exact names are a dict lookup. Other names fall back to the first known
+    name they contain (so e.g. "DataValidationError" still reads as a
+    validation error), and the result is cached per type name.
+    """
+    if error_type in _ERROR_PREFIXES:
+        return _ERROR_PREFIXES[error_type]
+    return next(
+        (prefix for name, prefix in _ERROR_PREFIXES.items() if name in error_type),
+        "Error",
+    )
 
 
 def handle_operation_error(error: Exception) -> None:
@@ -361,36 +499,6 @@ def handle_operation_error(error: Exception) -> None:
     error_type = type(error).__name__
     error_msg = str(error)
 
-    # Map error types to user-friendly messages using match/case
-    match error_type:
-        case et if "ColumnNotFoundError" in et:
-            typer.echo(f"Error: {error_msg}", err=True)
-        case et if "TypeMismatchError" in et:
-            typer.echo(f"Type mismatch: {error_msg}", err=True)
-        case et if "ValueOutOfRangeError" in et:
-            typer.echo(f"Value out of range: {error_msg}", err=True)
-        case et if "InvalidConditionError" in et:
-            typer.echo(f"Invalid condition: {error_msg}", err=True)
-        case et if "FilteringError" in et:
-            typer.echo(f"Filter error: {error_msg}", err=True)
-        case et if "SortingError" in et:
-            typer.echo(f"Sort error: {error_msg}", err=True)
-        case et if "PivotingError" in et:
-            typer.echo(f"Pivot error: {error_msg}", err=True)
-        case et if "AggregatingError" in et:
-            typer.echo(f"Aggregation error: {error_msg}", err=True)
-        case et if "ComparingError" in et:
-            typer.echo(f"Comparison error: {error_msg}", err=True)
-        case et if "CleaningError" in et:
-            typer.echo(f"Cleaning error: {error_msg}", err=True)
-        case et if "TransformingError" in et:
-            typer.echo(f"Transform error: {error_msg}", err=True)
-        case et if "JoiningError" in et:
-            typer.echo(f"Join error: {error_msg}", err=True)
-        case et if "ValidationError" in et:
-            typer.echo(f"Validation error: {error_msg}", err=True)
-        case _:
-            # Generic error handling
-            typer.echo(f"Error: {error_msg}", err=True)
+    typer.echo(f"{_error_prefix(error_type)}: {error_msg}", err=True)
 
     raise typer.Exit(1)
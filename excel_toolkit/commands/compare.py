@@ -5,17 +5,6 @@ Compare two files or sheets to identify differences.
 
 import typer
 
-from excel_toolkit.commands.common import (
-    read_data_file,
-    write_or_display,
-)
-from excel_toolkit.core import HandlerFactory
-from excel_toolkit.fp import is_err, unwrap, unwrap_err
-from excel_toolkit.operations.comparing import (
-    ComparisonResult,
-    compare_dataframes,
-)
-
 
 def compare(
     file1: str = typer.Argument(..., help="Path to first file (baseline)"),
@@ -43,6 +32,18 @@ def compare(
         xl compare data1.xlsx data2.xlsx --key-columns "ID,Date" --diffs-only --output changes.xlsx
         xl compare old.xlsx new.xlsx --sheet1 "Sheet1" --sheet2 "Sheet2" --output diff.xlsx
     """
+    from excel_toolkit.commands.common import (
+        read_data_file,
+        require_column_list,
+        write_or_display,
+    )
+    from excel_toolkit.core import get_handler_factory
+    from excel_toolkit.fp import is_err, unwrap, unwrap_err
+    from excel_toolkit.operations.comparing import (
+        ComparisonResult,
+        compare_dataframes,
+    )
+
     # 1. Read both files
     df1 = read_data_file(file1, sheet1)
     df2 = read_data_file(file2, sheet2)
@@ -55,26 +56,24 @@ def compare(
     if df1.empty:
         typer.echo(f"File1 is empty, File2 has {len(df2)} rows")
         # Mark all as added
-        df2["_diff_status"] = "added"
-        factory = HandlerFactory()
-        write_or_display(df2, factory, output, "table")
+        factory = get_handler_factory()
+        write_or_display(df2.assign(_diff_status="added"), factory, output, "table")
         raise typer.Exit(0)
 
     if df2.empty:
         typer.echo(f"File2 is empty, File1 has {len(df1)} rows")
         # Mark all as deleted
-        df1["_diff_status"] = "deleted"
-        factory = HandlerFactory()
-        write_or_display(df1, factory, output, "table")
+        factory = get_handler_factory()
+        write_or_display(df1.assign(_diff_status="deleted"), factory, output, "table")
         raise typer.Exit(0)
 
-    # 3. Parse key columns
-    key_cols = None
-    if key_columns:
-        key_cols = [c.strip() for c in key_columns.split(",")]
+    # 3. Parse key columns (positional comparison only when the option is omitted)
+    key_cols = (
+        require_column_list(key_columns, "--key-columns") if key_columns is not None else None
+    )
 
-    # 4. Compare dataframes
-    result = compare_dataframes(df1, df2, key_cols)
+    # 4. Compare dataframes (unchanged rows are never built for --diffs-only)
+    result = compare_dataframes(df1, df2, key_cols, include_unchanged=not show_diffs_only)
     if is_err(result):
         error = unwrap_err(result)
         typer.echo(f"Error comparing data: {error}", err=True)
@@ -97,17 +96,9 @@ def compare(
         typer.echo("No differences found - files are identical")
         raise typer.Exit(0)
 
-    # 6. Filter if diffs only requested
-    df_result = comparison.df_result
-    if show_diffs_only:
-        df_result = df_result[df_result["_diff_status"] != "unchanged"]
-        if df_result.empty:
-            typer.echo("No differences to display")
-            raise typer.Exit(0)
-
-    # 7. Write or display
-    factory = HandlerFactory()
-    write_or_display(df_result, factory, output, "table")
+    # 6. Write or display
+    factory = get_handler_factory()
+    write_or_display(comparison.df_result, factory, output, "table")
 
 
 # Create CLI app for this command
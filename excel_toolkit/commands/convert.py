@@ -7,9 +7,9 @@ from pathlib import Path
 
 import typer
 
-from excel_toolkit.commands.common import read_data_file
-from excel_toolkit.core import HandlerFactory
-from excel_toolkit.fp import is_err, unwrap_err
+# Output formats convert can write, and the same list as shown in errors
+_SUPPORTED_FORMATS = frozenset({".xlsx", ".xlsm", ".csv", ".json"})
+_SORTED_FORMATS = ", ".join(sorted(_SUPPORTED_FORMATS))
 
 
 def convert(
@@ -29,17 +29,19 @@ def convert(
         xl convert data.xlsx --output data.json
         xl convert multi_sheet.xlsx --sheet "Sheet2" --output sheet2.csv
     """
-    input_path = Path(file_path)
-    output_path = Path(output)
-    factory = HandlerFactory()
+    from excel_toolkit.commands.common import read_data_file
+    from excel_toolkit.core import get_handler_factory
+    from excel_toolkit.fp import is_err, unwrap_err
 
-    # 1. Validate output format
+    output_path = Path(output)
+    input_format = Path(file_path).suffix.lower()
     output_ext = output_path.suffix.lower()
-    supported_formats = {".xlsx", ".xlsm", ".csv", ".json"}
+    factory = get_handler_factory()
 
-    if output_ext not in supported_formats:
+    # 1. Validate output format
+    if output_ext not in _SUPPORTED_FORMATS:
         typer.echo(f"Error: Unsupported output format: {output_ext}", err=True)
-        typer.echo(f"Supported formats: {', '.join(sorted(supported_formats))}")
+        typer.echo(f"Supported formats: {_SORTED_FORMATS}")
         raise typer.Exit(1)
 
     # 2. Read input file
@@ -57,7 +59,6 @@ def convert(
         raise typer.Exit(1)
 
     # 5. Display summary
-    input_format = input_path.suffix.lower()
     typer.echo(f"Input format: {input_format}")
     typer.echo(f"Output format: {output_ext}")
     typer.echo(f"Rows: {len(df)}")
@@ -3,15 +3,18 @@
 Count occurrences of unique values in specified columns.
 """
 
+import numpy as np
 import pandas as pd
 import typer
+from pandas.api.types import is_string_dtype
 
 from excel_toolkit.commands.common import (
     read_data_file,
+    require_column_list,
     resolve_column_references,
     write_or_display,
 )
-from excel_toolkit.core import HandlerFactory
+from excel_toolkit.core import get_handler_factory
 
 
 def count(
@@ -58,37 +61,40 @@ def count(
         raise typer.Exit(0)
 
     # 4. Parse columns (supports both names and indices)
-    column_list = [c.strip() for c in columns.split(",")]
+    column_list = require_column_list(columns, "--columns")
     # Resolve column references (names or indices)
     column_list = resolve_column_references(column_list, df)
 
-    # 5. Count occurrences for each column
-    count_dfs = []
+    # 5. Count occurrences for each column (unsorted output only needs the first rows)
+    head = limit if sort in (None, "none") else None
+    value_counts = [_value_counts(df[col], head) for col in column_list]
 
-    for col in column_list:
-        # Get value counts
-        value_counts = df[col].value_counts().reset_index()
-        value_counts.columns = [col, "count"]
-
-        # Add column name for multi-column case
-        if len(column_list) > 1:
-            value_counts = value_counts.rename(columns={col: "value"})
-            value_counts.insert(0, "column", col)
-
-        count_dfs.append(value_counts)
-
-    # Combine all counts
-    if len(count_dfs) == 1:
-        df_counts = count_dfs[0]
+    if len(column_list) == 1:
+        df_counts = value_counts[0].reset_index()
+        df_counts.columns = [column_list[0], "count"]
     else:
-        df_counts = pd.concat(count_dfs, ignore_index=True)
+        # Stack the per-column counts directly instead of concatenating one frame per column
+        df_counts = pd.DataFrame(
+            {
+                "column": np.repeat(
+                    np.array(column_list, dtype=object), [len(c) for c in value_counts]
+                ),
+                "value": value_counts[0].index.append([c.index for c in value_counts[1:]]),
+                "count": np.concatenate([c.to_numpy() for c in value_counts]),
+            }
+        )
 
     # 6. Sort if requested
     if sort == "count":
         # Sort by count (descending by default)
         sort_column = "count"
         ascending_order = ascending
-        df_counts = df_counts.sort_values(by=sort_column, ascending=ascending_order)
+        if limit is not None and limit > 0:
+            # Select only the top rows instead of sorting every count
+            select = df_counts.nsmallest if ascending_order else df_counts.nlargest
+            df_counts = select(limit, sort_column)
+        else:
+            df_counts = df_counts.sort_values(by=sort_column, ascending=ascending_order)
     elif sort == "name":
         # Sort by value name (ascending by default)
         if len(column_list) == 1:
@@ -118,10 +124,35 @@ def count(
     typer.echo("")
 
     # 8. Write or display
-    factory = HandlerFactory()
+    factory = get_handler_factory()
     write_or_display(df_counts, factory, output, "table")
 
 
+def _value_counts(series: pd.Series, head: int | None = None) -> pd.Series:
+    """Count non-missing values, most frequent first.
+
+    Text columns are dictionary-encoded with pd.factorize and counted with
+    np.bincount on the integer codes, which avoids hashing every Python
+    string into a counts table. Ties keep first-appearance order. Other
+    columns are already fast with Series.value_counts().
+
+    When only the first ``head`` rows are needed and the column holds no
+    repeated or missing values (e.g. an ID column), every count is 1 and
+    the leading values are returned without building a counts table.
+    """
+    if head is not None and not series.hasnans and series.is_unique:
+        values = series.head(head)
+        return pd.Series(np.ones(len(values), dtype=np.int64), index=values, name="count")
+
+    if not is_string_dtype(series.dtype):
+        return series.value_counts()
+
+    codes, uniques = pd.factorize(series)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    order = np.argsort(-counts, kind="stable")
+    return pd.Series(counts[order], index=uniques[order], name="count")
+
+
 # Create CLI app for this command
 app = typer.Typer(help="Count occurrences of unique values in specified columns")
 
@@ -8,9 +8,10 @@ import typer
 from excel_toolkit.commands.common import (
     display_table,
     read_data_file,
+    require_column_list,
     write_or_display,
 )
-from excel_toolkit.core import HandlerFactory
+from excel_toolkit.core import get_handler_factory
 from excel_toolkit.fp import is_err, unwrap, unwrap_err
 from excel_toolkit.operations.cleaning import remove_duplicates
 
@@ -59,7 +60,7 @@ def dedupe(
     # 5. Parse columns for deduplication
     subset = None
     if by:
-        subset = [c.strip() for c in by.split(",")]
+        subset = require_column_list(by, "--by")
         # Validate columns exist
         missing_cols = [c for c in subset if c not in df.columns]
         if missing_cols:
@@ -67,17 +68,7 @@ def dedupe(
             typer.echo(f"Available columns: {', '.join(df.columns)}")
             raise typer.Exit(1)
 
-    # 6. Count duplicates before removal
-    duplicated_mask = df.duplicated(subset=subset, keep=keep_param)
-    duplicate_count = duplicated_mask.sum()
-
-    if duplicate_count == 0:
-        typer.echo("No duplicates found")
-        if not dry_run and not output:
-            display_table(df)
-        raise typer.Exit(0)
-
-    # 7. Remove duplicates using operation
+    # 6. Remove duplicates using operation
     result = remove_duplicates(df, subset=subset, keep=keep_param)
 
     if is_err(result):
@@ -89,6 +80,15 @@ def dedupe(
     deduped_count = len(df_dedupe)
     removed_count = original_count - deduped_count
 
+    # 7. Every row flagged as a duplicate is removed, so the counts match
+    duplicate_count = removed_count
+
+    if duplicate_count == 0:
+        typer.echo("No duplicates found")
+        if not dry_run and not output:
+            display_table(df)
+        raise typer.Exit(0)
+
     # 8. Display summary
     typer.echo(f"Original rows: {original_count}")
     typer.echo(f"Duplicate rows found: {duplicate_count}")
@@ -111,17 +111,13 @@ def dedupe(
             typer.echo("")
             typer.echo("Preview of removed duplicate rows:")
             removed_rows = min(5, removed_count)
-            if keep == "none":
-                # Show all duplicate rows (both first and subsequent occurrences)
-                all_dupes = df[df.duplicated(subset=subset, keep=False)]
-                display_table(all_dupes.head(removed_rows))
-            else:
-                # Show only the rows that were removed
-                display_table(df[duplicated_mask].head(removed_rows))
+            # keep_param is False for "none", which flags every occurrence of a duplicate
+            duplicated_mask = df.duplicated(subset=subset, keep=keep_param)
+            display_table(df[duplicated_mask].head(removed_rows))
         raise typer.Exit(0)
 
     # 10. Write or display
-    factory = HandlerFactory()
+    factory = get_handler_factory()
     write_or_display(df_dedupe, factory, output, "table")
 
 
@@ -5,9 +5,11 @@ Export data to various formats with customizable options.
 
 from pathlib import Path
 
+import pandas as pd
 import typer
 
 from excel_toolkit.commands.common import read_data_file
+from excel_toolkit.core import write_delimited
 
 
 def export(
@@ -60,17 +62,16 @@ def export(
     output_path = Path(output)
 
     try:
-        if format == "csv":
-            # Use specified delimiter or default to comma
+        if format in ["csv", "tsv"]:
+            # Use specified delimiter for CSV; TSV is just CSV with tab delimiter
             sep = delimiter if format != "tsv" else "\t"
-            df.to_csv(
-                output_path, index=index, sep=sep, encoding=encoding, float_format=float_format
-            )
-
-        elif format == "tsv":
-            # TSV is just CSV with tab delimiter
-            df.to_csv(
-                output_path, index=index, sep="\t", encoding=encoding, float_format=float_format
+            write_delimited(
+                df,
+                output_path,
+                encoding=encoding,
+                delimiter=sep,
+                index=index,
+                float_format=float_format,
             )
 
         elif format == "json":
@@ -86,7 +87,7 @@ def export(
         elif format == "parquet":
             # Parquet requires pyarrow or fastparquet
             try:
-                df.to_parquet(output_path, index=index)
+                _write_parquet(df, output_path, index)
             except ImportError:
                 typer.echo(
                     "Error: Parquet export requires 'pyarrow' or 'fastparquet' package", err=True
@@ -118,6 +119,30 @@ def export(
         raise typer.Exit(1)
 
 
+def _write_parquet(df: pd.DataFrame, output_path: Path, index: bool) -> None:
+    """Write a Parquet file, using ZSTD and dictionary encoding with pyarrow.
+
+    Without pyarrow this falls back to DataFrame.to_parquet (fastparquet),
+    which raises ImportError when no Parquet engine is installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        df.to_parquet(output_path, index=index)
+        return
+
+    table = pa.Table.from_pandas(df, preserve_index=index)
+    pq.write_table(
+        table,
+        output_path,
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=True,
+        data_page_size=1 << 20,
+    )
+
+
 # Create CLI app for this command
 app = typer.Typer(help="Export data to various formats")
 
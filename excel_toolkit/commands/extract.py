@@ -11,7 +11,7 @@ from excel_toolkit.commands.common import (
     read_data_file,
     write_or_display,
 )
-from excel_toolkit.core import HandlerFactory
+from excel_toolkit.core import get_handler_factory
 
 
 def extract(
@@ -88,7 +88,8 @@ def extract(
         typer.echo(f"Column type: {df[resolved_column].dtype}")
         raise typer.Exit(1)
 
-    # 6. Extract parts
+    # 6. Extract parts, reading fields through one datetime accessor
+    dates = df[resolved_column].dt
     new_columns = {}
     for part in parts_list:
         if suffix:
@@ -96,28 +97,17 @@ def extract(
         else:
             col_name = f"{resolved_column}_{part}"
 
-        if part == "year":
-            new_columns[col_name] = df[resolved_column].dt.year
-        elif part == "month":
-            new_columns[col_name] = df[resolved_column].dt.month
-        elif part == "day":
-            new_columns[col_name] = df[resolved_column].dt.day
-        elif part == "hour":
-            new_columns[col_name] = df[resolved_column].dt.hour
-        elif part == "minute":
-            new_columns[col_name] = df[resolved_column].dt.minute
-        elif part == "second":
-            new_columns[col_name] = df[resolved_column].dt.second
-        elif part == "quarter":
-            new_columns[col_name] = df[resolved_column].dt.quarter
-        elif part == "dayofweek":
-            new_columns[col_name] = df[resolved_column].dt.dayofweek
-        elif part == "weekofyear":
-            new_columns[col_name] = df[resolved_column].dt.isocalendar().week
-
-    # 7. Add new columns to dataframe
-    for col_name, col_data in new_columns.items():
-        df[col_name] = col_data
+        if part == "weekofyear":
+            new_columns[col_name] = dates.isocalendar().week
+        else:
+            new_columns[col_name] = getattr(dates, part)
+
+    # 7. Add new columns to dataframe in one block, overwriting same-named columns in place
+    extracted = pd.DataFrame(new_columns, index=df.index)
+    replaced = df.columns.intersection(extracted.columns)
+    if not replaced.empty:
+        df[replaced] = extracted[replaced]
+    df = pd.concat([df, extracted.drop(columns=replaced)], axis=1)
 
     # 8. Display summary
     typer.echo(f"Extracted {len(new_columns)} parts from '{resolved_column}'")
@@ -136,7 +126,7 @@ def extract(
         raise typer.Exit(0)
 
     # 10. Write or display
-    factory = HandlerFactory()
+    factory = get_handler_factory()
     write_or_display(df, factory, output, "table")
 
 
@@ -8,9 +8,10 @@ import typer
 from excel_toolkit.commands.common import (
     display_table,
     read_data_file,
+    require_column_list,
     write_or_display,
 )
-from excel_toolkit.core import HandlerFactory
+from excel_toolkit.core import get_handler_factory
 from excel_toolkit.fp import is_err, unwrap, unwrap_err
 from excel_toolkit.operations.cleaning import fill_missing_values
 
@@ -69,9 +70,9 @@ def fill(
         typer.echo("File is empty (no data rows)")
         raise typer.Exit(0)
 
-    # 5. Determine columns to fill
+    # 5. Determine columns to fill, counting missing values per column in one scan
     if columns:
-        column_list = [c.strip() for c in columns.split(",")]
+        column_list = require_column_list(columns, "--columns")
         # Validate columns exist
         missing_cols = [c for c in column_list if c not in df.columns]
         if missing_cols:
@@ -79,16 +80,20 @@ def fill(
             typer.echo(f"Available columns: {', '.join(df.columns)}")
             raise typer.Exit(1)
         target_columns = column_list
+        null_counts = df[target_columns].isnull().sum()
+        gap_columns = null_counts.index[null_counts > 0].tolist()
     else:
         # Fill all columns with missing values
-        target_columns = df.columns[df.isnull().any()].tolist()
+        null_counts = df.isnull().sum()
+        null_counts = null_counts[null_counts > 0]
+        target_columns = gap_columns = null_counts.index.tolist()
 
     if not target_columns:
         typer.echo("No columns with missing values found")
         raise typer.Exit(0)
 
     # 6. Count missing values before filling
-    missing_before = df[target_columns].isnull().sum().sum()
+    missing_before = null_counts.sum()
 
     # 7. Apply fill strategy using operation
     if fill_value:
@@ -104,6 +109,9 @@ def fill(
         result = fill_missing_values(
             df, strategy="constant", columns=target_columns, value=fill_value_arg
         )
+    elif fill_strategy in ("forward", "backward"):
+        # Forward/backward fill leaves complete columns unchanged, so skip them
+        result = fill_missing_values(df, strategy=fill_strategy, columns=gap_columns)
     else:
         result = fill_missing_values(df, strategy=fill_strategy, columns=target_columns)
 
@@ -124,19 +132,19 @@ def fill(
             display_table(df)
         raise typer.Exit(0)
 
-    # 9. Display summary
-    typer.echo(f"Missing values before: {missing_before}")
-    typer.echo(f"Missing values after: {missing_after}")
-    typer.echo(f"Values filled: {filled_count}")
-    if strategy:
-        typer.echo(f"Strategy: {strategy}")
-    else:
-        typer.echo(f"Value: {value}")
+    # 9. Display summary (written in one call)
+    lines = [
+        f"Missing values before: {missing_before}",
+        f"Missing values after: {missing_after}",
+        f"Values filled: {filled_count}",
+        f"Strategy: {strategy}" if strategy else f"Value: {value}",
+    ]
     if columns:
-        typer.echo(f"Columns: {', '.join(target_columns)}")
+        lines.append(f"Columns: {', '.join(target_columns)}")
     else:
-        typer.echo("Columns: all columns with missing values")
-    typer.echo("")
+        lines.append("Columns: all columns with missing values")
+    lines.append("")
+    typer.echo("\n".join(lines))
 
     # 10. Handle dry-run mode
     if dry_run:
@@ -146,7 +154,7 @@ def fill(
         raise typer.Exit(0)
 
     # 11. Write or display
-    factory = HandlerFactory()
+    factory = get_handler_factory()
     write_or_display(df_filled, factory, output, "table")
 
 
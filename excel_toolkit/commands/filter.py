@@ -8,10 +8,11 @@ import typer
 from excel_toolkit.commands.common import (
     display_table,
     read_data_file,
+    require_column_list,
     resolve_column_references,
     write_or_display,
 )
-from excel_toolkit.core import HandlerFactory
+from excel_toolkit.core import get_handler_factory
 from excel_toolkit.fp import is_err, unwrap, unwrap_err
 from excel_toolkit.operations.filtering import (
     apply_filter,
@@ -74,7 +75,7 @@ def filter(
     # 5. Parse columns (supports both names and indices)
     col_list = None
     if columns:
-        col_list = [c.strip() for c in columns.split(",")]
+        col_list = require_column_list(columns, "--columns")
         # Resolve column references (names or indices)
         col_list = resolve_column_references(col_list, df)
 
@@ -107,14 +108,16 @@ def filter(
         typer.echo("No rows match the filter condition")
         typer.echo(f"Condition: {condition}")
         if output:
-            factory = HandlerFactory()
+            factory = get_handler_factory()
             write_or_display(df_filtered, factory, output, format)
         raise typer.Exit(0)
 
     # 9. Display summary
     percentage = (filtered_count / original_count * 100) if original_count > 0 else 0
-    typer.echo(f"Filtered {filtered_count} of {original_count} rows ({percentage:.1f}%)")
-    typer.echo(f"Condition: {condition}")
+    typer.echo(
+        f"Filtered {filtered_count} of {original_count} rows ({percentage:.1f}%)\n"
+        f"Condition: {condition}"
+    )
 
     if filtered_count == original_count:
         typer.echo("Warning: All rows match the condition", err=True)
@@ -122,7 +125,7 @@ def filter(
     typer.echo("")
 
     # 10. Write or display
-    factory = HandlerFactory()
+    factory = get_handler_factory()
     write_or_display(df_filtered, factory, output, format)
 
 
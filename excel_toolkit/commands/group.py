@@ -8,10 +8,11 @@ import typer
 from excel_toolkit.commands.common import (
     display_table,
     read_data_file,
+    require_column_list,
     resolve_column_references,
     write_or_display,
 )
-from excel_toolkit.core import HandlerFactory
+from excel_toolkit.core import get_handler_factory
 from excel_toolkit.fp import is_err, unwrap, unwrap_err
 from excel_toolkit.operations.aggregating import (
     aggregate_groups,
@@ -96,7 +97,7 @@ def group(
     agg_specs = unwrap(parse_result)
 
     # 6. Parse group columns (supports both names and indices)
-    group_cols = [c.strip() for c in by.split(",")]
+    group_cols = require_column_list(by, "--by")
     # Resolve column references (names or indices)
     group_cols = resolve_column_references(group_cols, df)
 
@@ -154,19 +155,22 @@ def group(
         # Reset index after sorting
         df_grouped = df_grouped.reset_index(drop=True)
 
-    # 9. Display summary
-    typer.echo(f"Original rows: {original_count}")
-    typer.echo(f"Grouped rows: {grouped_count}")
-    typer.echo(f"Grouped by: {', '.join(group_cols)}")
-    typer.echo(f"Aggregations: {aggregate}")
+    # 9. Display summary (written in one call)
+    lines = [
+        f"Original rows: {original_count}",
+        f"Grouped rows: {grouped_count}",
+        f"Grouped by: {', '.join(group_cols)}",
+        f"Aggregations: {aggregate}",
+    ]
     if sort:
         sort_col_display = (
             sort_column
             if sort_column
             else [col for col in df_grouped.columns if col not in group_cols][0]
         )
-        typer.echo(f"Sorted by: {sort_col_display} ({sort})")
-    typer.echo("")
+        lines.append(f"Sorted by: {sort_col_display} ({sort})")
+    lines.append("")
+    typer.echo("\n".join(lines))
 
     # 10. Handle dry-run mode
     if dry_run:
@@ -176,7 +180,7 @@ def group(
         raise typer.Exit(0)
 
     # 11. Write or display
-    factory = HandlerFactory()
+    factory = get_handler_factory()
     write_or_display(df_grouped, factory, output, "table")
 
 
@@ -3,8 +3,6 @@
 Displays the last N rows of a data file in various formats.
 """
 
-from pathlib import Path
-
 import typer
 
 from excel_toolkit.commands.common import (
@@ -66,9 +64,8 @@ def tail(
     df_tail = df.tail(rows)
 
     # 5. Display file info
-    path = Path(file_path)
     typer.echo(
-        format_file_info(str(path), sheet=sheet, total_rows=len(df), total_cols=len(df.columns))
+        format_file_info(file_path, sheet=sheet, total_rows=len(df), total_cols=len(df.columns))
     )
 
     # 6. Show column information if requested
@@ -20,6 +20,7 @@ Example:
 # Public API - Handlers
 # Public API - Constants
 from excel_toolkit.core.const import (
+    CSV_WRITE_BUFFER_SIZE,
     DEFAULT_CSV_DELIMITER,
     DEFAULT_CSV_ENCODING,
     DEFAULT_SHEET_NAME,
@@ -43,6 +44,8 @@ from excel_toolkit.core.file_handlers import (
     CSVHandler,
     ExcelHandler,
     HandlerFactory,
+    get_handler_factory,
+    write_delimited,
 )
 
 __all__ = [
@@ -50,6 +53,8 @@ __all__ = [
     "ExcelHandler",
     "CSVHandler",
     "HandlerFactory",
+    "get_handler_factory",
+    "write_delimited",
     # Exceptions
     "FileHandlerError",
     "FileNotFoundError",
@@ -64,6 +69,7 @@ __all__ = [
     "DEFAULT_SHEET_NAME",
     "DEFAULT_CSV_ENCODING",
     "DEFAULT_CSV_DELIMITER",
+    "CSV_WRITE_BUFFER_SIZE",
     "MAX_FILE_SIZE_MB",
     "WARNING_FILE_SIZE_MB",
 ]
@@ -26,6 +26,12 @@ DEFAULT_EXCEL_ENGINE = "openpyxl"
 MAX_FILE_SIZE_MB = 500
 WARNING_FILE_SIZE_MB = 100
 
+# Bytes read from the start of a file for encoding detection
+ENCODING_SAMPLE_SIZE = 4096
+
+# Write buffer size for CSV output; larger buffers mean fewer write syscalls
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
 # Encoding detection order (most common first)
 ENCODING_DETECTION_ORDER = [
     "utf-8",
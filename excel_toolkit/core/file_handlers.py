@@ -7,17 +7,22 @@ explicit error handling.
 
 # type: ignore  # Uses Python 3.14 syntax (except*), CI uses Python 3.13
 
+import codecs
+import io
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from excel_toolkit.core.const import (
+    CSV_WRITE_BUFFER_SIZE,
     DEFAULT_CSV_DELIMITER,
     DEFAULT_CSV_ENCODING,
     DEFAULT_EXCEL_ENGINE,
     DEFAULT_SHEET_NAME,
     DELIMITER_CANDIDATES,
     ENCODING_DETECTION_ORDER,
+    ENCODING_SAMPLE_SIZE,
     MAX_FILE_SIZE_MB,
     SUPPORTED_READ_FORMATS,
     SUPPORTED_WRITE_FORMATS,
@@ -367,9 +372,8 @@ class CSVHandler:
         if path.parent != Path(".") and not path.parent.exists():
             return err(FileNotFoundError(f"Directory not found: {path.parent}"))
 
-        # Try writing
         try:
-            df.to_csv(path, encoding=encoding, sep=delimiter, index=index, **kwargs)
+            write_delimited(df, path, encoding, delimiter, index, **kwargs)
             return ok(None)
         except PermissionError as e:
             return err(FileAccessError(f"Permission denied: {path} - {str(e)}"))
@@ -379,7 +383,8 @@ class CSVHandler:
     def detect_encoding(self, path: Path) -> Result[str, FileHandlerError]:
         """Auto-detect file encoding.
 
-        Tries common encodings in order and returns the first one that succeeds.
+        Reads a bounded sample from the start of the file once and tries
+        common encodings on it in order, returning the first one that succeeds.
 
         Args:
             path: Path to file
@@ -388,22 +393,11 @@ class CSVHandler:
             Result[str, FileHandlerError]
             Detected encoding if successful
         """
-        # Validate file exists
-        if not path.exists():
-            return err(FileNotFoundError(f"File not found: {path}"))
+        sample_result = self._read_sample(path)
+        if is_err(sample_result):
+            return sample_result  # type: ignore
 
-        # Try each encoding
-        for encoding in ENCODING_DETECTION_ORDER:
-            try:
-                with open(path, "r", encoding=encoding) as f:
-                    f.read(1024)  # Try reading first 1KB
-                return ok(encoding)
-            except UnicodeDecodeError, LookupError:
-                continue
-            except Exception as e:
-                return err(FileAccessError(f"Cannot read file: {str(e)}"))
-
-        return err(EncodingError("Could not detect file encoding"))
+        return self._encoding_from_sample(unwrap(sample_result))
 
     def detect_delimiter(
         self, path: Path, encoding: str = DEFAULT_CSV_ENCODING
@@ -431,17 +425,89 @@ class CSVHandler:
         except Exception as e:
             return err(FileAccessError(f"Cannot read file: {str(e)}"))
 
+        return ok(self._delimiter_from_line(first_line))
+
+    def detect_format(self, path: Path) -> Result[tuple[str, str], FileHandlerError]:
+        """Auto-detect both encoding and delimiter from a single sample.
+
+        Same results as detect_encoding() followed by detect_delimiter(), but
+        the delimiter is taken from the first line of the encoding sample, so
+        the file is only opened again when that line is longer than the sample.
+
+        Args:
+            path: Path to CSV file
+
+        Returns:
+            Result[tuple[str, str], FileHandlerError]
+            (encoding, delimiter) if successful
+        """
+        sample_result = self._read_sample(path)
+        if is_err(sample_result):
+            return sample_result  # type: ignore
+
+        sample = unwrap(sample_result)
+        encoding_result = self._encoding_from_sample(sample)
+        if is_err(encoding_result):
+            return encoding_result  # type: ignore
+
+        encoding = unwrap(encoding_result)
+        text = codecs.getincrementaldecoder(encoding)(errors="replace").decode(sample)
+        first_line = io.StringIO(text, newline=None).readline()
+
+        # A first line that fills the whole sample may continue past it
+        if not first_line.endswith("\n") and len(sample) == ENCODING_SAMPLE_SIZE:
+            delimiter_result = self.detect_delimiter(path, encoding)
+            if is_err(delimiter_result):
+                return delimiter_result  # type: ignore
+            return ok((encoding, unwrap(delimiter_result)))
+
+        return ok((encoding, self._delimiter_from_line(first_line)))
+
+    def _read_sample(self, path: Path) -> Result[bytes, FileHandlerError]:
+        """Read the bytes used for format detection from the start of a file."""
+        # Validate file exists
+        if not path.exists():
+            return err(FileNotFoundError(f"File not found: {path}"))
+
+        try:
+            with open(path, "rb") as f:
+                return ok(f.read(ENCODING_SAMPLE_SIZE))
+        except Exception as e:
+            return err(FileAccessError(f"Cannot read file: {str(e)}"))
+
+    def _encoding_from_sample(self, sample: bytes) -> Result[str, FileHandlerError]:
+        """Pick the first candidate encoding that decodes the sample."""
+        # A UTF-8 byte order mark settles it; utf-8-sig also strips the mark
+        if sample.startswith(codecs.BOM_UTF8):
+            return ok("utf-8-sig")
+
+        # Pure ASCII decodes under every candidate, so the first one wins
+        if sample.isascii():
+            return ok(ENCODING_DETECTION_ORDER[0])
+
+        # Try each encoding; the sample may end mid-character, so decode incrementally
+        for encoding in ENCODING_DETECTION_ORDER:
+            try:
+                codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+                return ok(encoding)
+            except UnicodeDecodeError, LookupError:
+                continue
+
+        return err(EncodingError("Could not detect file encoding"))
+
+    def _delimiter_from_line(self, line: str) -> str:
+        """Pick the delimiter candidate that occurs most often in a line."""
         # Count occurrences of each delimiter candidate
-        counts = {delim: first_line.count(delim) for delim in DELIMITER_CANDIDATES}
+        counts = {delim: line.count(delim) for delim in DELIMITER_CANDIDATES}
 
         # Return delimiter with highest count
         best_delimiter = max(counts, key=counts.get)
 
         # If all counts are 0, default to comma
         if counts[best_delimiter] == 0:
-            return ok(DEFAULT_CSV_DELIMITER)
+            return DEFAULT_CSV_DELIMITER
 
-        return ok(best_delimiter)
+        return best_delimiter
 
 
 class HandlerFactory:
@@ -530,3 +596,55 @@ class HandlerFactory:
             Set of file extensions (e.g., {".xlsx", ".csv"})
         """
         return set(SUPPORTED_WRITE_FORMATS.keys())
+
+
+@lru_cache(maxsize=1)
+def get_handler_factory() -> HandlerFactory:
+    """Get the shared HandlerFactory instance.
+
+    Handlers are stateless, so one factory can serve every command instead
+    of building a new one (and its handlers) per call.
+
+    Returns:
+        Shared HandlerFactory instance
+    """
+    return HandlerFactory()
+
+
+def write_delimited(
+    df: "pd.DataFrame",
+    path: Path,
+    encoding: str = DEFAULT_CSV_ENCODING,
+    delimiter: str = DEFAULT_CSV_DELIMITER,
+    index: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Write DataFrame as delimited text to any path, raising on failure.
+
+    Unlike CSVHandler.write(), the file extension is not checked, so this
+    also serves TSV and other delimited outputs.
+
+    Args:
+        df: DataFrame to write
+        path: Output file path
+        encoding: File encoding
+        delimiter: Column delimiter
+        index: Whether to write row indices
+        **kwargs: Additional pandas to_csv parameters
+    """
+    if "compression" in kwargs or "storage_options" in kwargs:
+        # pandas only compresses (or uses fsspec) when it opens the file itself
+        df.to_csv(path, sep=delimiter, index=index, encoding=encoding, **kwargs)
+        return
+
+    # Write through one large buffer instead of pandas' default-sized one;
+    # mode and errors apply to the handle, which pandas would ignore
+    with open(
+        path,
+        kwargs.pop("mode", "w"),
+        encoding=encoding,
+        errors=kwargs.pop("errors", "strict"),
+        newline="",
+        buffering=CSV_WRITE_BUFFER_SIZE,
+    ) as f:
+        df.to_csv(f, sep=delimiter, index=index, **kwargs)
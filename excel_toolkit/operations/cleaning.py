@@ -204,8 +204,9 @@ def fill_missing_values(
     """
     valid_strategies = ["forward", "backward", "mean", "median", "constant", "drop"]
 
-    # Create a copy to avoid modifying original
-    df_filled = df.copy()
+    # Shallow copy: filled columns are replaced, never written into, so the
+    # original keeps its data without duplicating untouched columns
+    df_filled = df.copy(deep=False)
 
     try:
         if isinstance(strategy, dict):
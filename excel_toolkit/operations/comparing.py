@@ -7,6 +7,7 @@ All functions return Result types for explicit error handling.
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from excel_toolkit.fp import Result, err, is_err, ok, unwrap, unwrap_err
@@ -83,10 +84,12 @@ def validate_key_columns(
         return ok([])
 
     # Check key columns exist in df1
-    missing_df1 = [c for c in key_columns if c not in df1.columns]
+    columns_df1 = set(df1.columns)
+    missing_df1 = [c for c in key_columns if c not in columns_df1]
 
     # Check key columns exist in df2
-    missing_df2 = [c for c in key_columns if c not in df2.columns]
+    columns_df2 = set(df2.columns)
+    missing_df2 = [c for c in key_columns if c not in columns_df2]
 
     # Collect all missing columns
     all_missing = list(set(missing_df1 + missing_df2))
@@ -164,50 +167,172 @@ def find_differences(
         DifferencesResult - Sets of indices for each difference type
 
     Implementation:
-        - If key_columns is empty, use row position as key
+        - If key_columns is empty, compare by row position
         - Set key columns as index for both DataFrames
         - Find indices only in df1 (deleted)
         - Find indices only in df2 (added)
-        - Find common indices and compare values
+        - Find common indices and compare values (vectorized when keys are unique,
+          with one hash lookup of df1 keys in df2)
         - Return DifferencesResult
     """
-    # Make copies to avoid modifying originals
-    df1_copy = df1.copy()
-    df2_copy = df2.copy()
+    if not key_columns:
+        # Row positions need no index at all
+        return _find_positional_differences(df1, df2)
 
-    if key_columns:
-        # Use key columns as index
-        df1_indexed = df1_copy.set_index(key_columns)
-        df2_indexed = df2_copy.set_index(key_columns)
-    else:
-        # Use row position as index
-        df1_indexed = df1_copy.reset_index(drop=True)
-        df2_indexed = df2_copy.reset_index(drop=True)
+    # Use key columns as index (set_index returns new frames, originals are untouched)
+    df1_indexed = df1.set_index(key_columns)
+    df2_indexed = df2.set_index(key_columns)
+
+    if df1_indexed.index.is_unique and df2_indexed.index.is_unique:
+        return _find_keyed_differences(df1_indexed, df2_indexed)
 
+    # Duplicate keys: index set operations with sort=False skip sorting
+    # results that are only iterated afterwards
     # Find indices only in df1 (deleted)
-    only_df1 = set(df1_indexed.index) - set(df2_indexed.index)
+    only_df1 = set(df1_indexed.index.difference(df2_indexed.index, sort=False))
 
     # Find indices only in df2 (added)
-    only_df2 = set(df2_indexed.index) - set(df1_indexed.index)
+    only_df2 = set(df2_indexed.index.difference(df1_indexed.index, sort=False))
 
     # Find common indices
-    common_indices = set(df1_indexed.index) & set(df2_indexed.index)
+    common_indices = df1_indexed.index.intersection(df2_indexed.index, sort=False)
+
+    # Duplicate keys select several rows per key; compare them group by group
+    modified_rows = _find_modified_duplicate_keys(df1_indexed, df2_indexed, common_indices)
+
+    return DifferencesResult(only_df1=only_df1, only_df2=only_df2, modified_rows=modified_rows)
+
+
+def _find_keyed_differences(
+    df1_indexed: pd.DataFrame, df2_indexed: pd.DataFrame
+) -> DifferencesResult:
+    """Find differences between two DataFrames indexed by unique keys.
+
+    Every df1 key is looked up in df2 with a single hash probe
+    (Index.get_indexer). The resulting positions give the deleted keys, the
+    added keys, and the matching df2 rows for each common key, so no further
+    index set operations or label lookups are needed.
+
+    Args:
+        df1_indexed: First DataFrame, indexed by key (unique index)
+        df2_indexed: Second DataFrame, indexed by key (unique index)
+
+    Returns:
+        DifferencesResult - Sets of keys for each difference type
+    """
+    positions = df2_indexed.index.get_indexer(df1_indexed.index)
+    in_df2 = positions >= 0
+    common_positions = positions[in_df2]
+
+    matched = np.zeros(len(df2_indexed), dtype=bool)
+    matched[common_positions] = True
+
+    only_df1 = set(df1_indexed.index[~in_df2])
+    only_df2 = set(df2_indexed.index[~matched])
+
+    rows1 = df1_indexed[in_df2]
+    modified = _modified_mask(rows1, df2_indexed.iloc[common_positions])
+    modified_rows = rows1.index[modified].tolist()
+
+    return DifferencesResult(only_df1=only_df1, only_df2=only_df2, modified_rows=modified_rows)
+
+
+def _find_modified_duplicate_keys(
+    df1_indexed: pd.DataFrame, df2_indexed: pd.DataFrame, common_indices: pd.Index
+) -> list[Any]:
+    """Find common keys whose rows differ when keys may repeat.
+
+    Rows are numbered within each key, so the n-th row of a key in df1 is
+    compared with the n-th row of the same key in df2 through the unique-key
+    path. A key is modified when any of its rows differ or when it has a
+    different number of rows in each DataFrame.
+
+    Args:
+        df1_indexed: First DataFrame, indexed by key
+        df2_indexed: Second DataFrame, indexed by key
+        common_indices: Keys present in both DataFrames
+
+    Returns:
+        List of common keys with different rows
+    """
+    numbered1 = _number_repeated_keys(df1_indexed[df1_indexed.index.isin(common_indices)])
+    numbered2 = _number_repeated_keys(df2_indexed[df2_indexed.index.isin(common_indices)])
+    differences = _find_keyed_differences(numbered1, numbered2)
+
+    # Drop the row number to get back to the key
+    nlevels = df1_indexed.index.nlevels
+    modified_keys = [
+        numbered[:-1] if nlevels > 1 else numbered[0]
+        for numbered in (
+            *differences.only_df1,
+            *differences.only_df2,
+            *differences.modified_rows,
+        )
+    ]
+    return common_indices[common_indices.isin(modified_keys)].tolist()
+
+
+def _number_repeated_keys(df_indexed: pd.DataFrame) -> pd.DataFrame:
+    """Append each row's position within its key as a last index level."""
+    index = df_indexed.index
+    levels = list(range(index.nlevels))
+    numbers = df_indexed.groupby(level=levels, sort=False, dropna=False).cumcount()
+    keys = [index.get_level_values(level) for level in levels]
+    return df_indexed.set_axis(pd.MultiIndex.from_arrays([*keys, numbers.to_numpy()]))
 
-    # Find modified rows
-    modified_rows = []
-    for idx in common_indices:
-        row1 = df1_indexed.loc[idx]
-        row2 = df2_indexed.loc[idx]
 
-        # Compare rows
-        if not compare_rows(row1, row2):
-            modified_rows.append(idx)
+def _find_positional_differences(df1: pd.DataFrame, df2: pd.DataFrame) -> DifferencesResult:
+    """Find differences between two DataFrames compared by row position.
+
+    Rows past the end of the shorter DataFrame are deleted or added, and the
+    shared row range is compared in one pass.
+
+    Args:
+        df1: First DataFrame
+        df2: Second DataFrame
+
+    Returns:
+        DifferencesResult - Sets of row positions for each difference type
+    """
+    shared = min(len(df1), len(df2))
+    only_df1 = set(range(shared, len(df1)))
+    only_df2 = set(range(shared, len(df2)))
+
+    modified = _modified_mask(df1.iloc[:shared], df2.iloc[:shared])
+    modified_rows = np.flatnonzero(modified).tolist()
 
     return DifferencesResult(only_df1=only_df1, only_df2=only_df2, modified_rows=modified_rows)
 
 
+def _modified_mask(rows1: pd.DataFrame, rows2: pd.DataFrame) -> np.ndarray:
+    """Flag which rows differ between two row-aligned DataFrames.
+
+    Vectorized equivalent of calling compare_rows() per row pair: values are
+    compared column by column, NaN in both frames counts as equal, and rows
+    are always different when the frames do not share the same columns.
+
+    Args:
+        rows1: Rows from the first DataFrame
+        rows2: Matching rows from the second DataFrame, in the same order
+
+    Returns:
+        Boolean array, True where the rows differ
+    """
+    if len(rows1.columns) != len(rows2.columns) or set(rows1.columns) != set(rows2.columns):
+        return np.ones(len(rows1), dtype=bool)
+
+    rows2 = rows2[rows1.columns].set_axis(rows1.index)
+
+    same = (rows1 == rows2) | (rows1.isna() & rows2.isna())
+    return ~same.all(axis=1).to_numpy()
+
+
 def build_comparison_result(
-    df1: pd.DataFrame, df2: pd.DataFrame, differences: DifferencesResult, key_columns: list[str]
+    df1: pd.DataFrame,
+    df2: pd.DataFrame,
+    differences: DifferencesResult,
+    key_columns: list[str],
+    include_unchanged: bool = True,
 ) -> pd.DataFrame:
     """Build comparison result DataFrame.
 
@@ -216,101 +341,66 @@ def build_comparison_result(
         df2: Second DataFrame
         differences: DifferencesResult from find_differences()
         key_columns: Columns used as keys
+        include_unchanged: Whether to include rows with no differences
 
     Returns:
         pd.DataFrame - Result with _diff_status column
 
     Implementation:
-        - Create result DataFrame
-        - Add rows only in df1 (deleted)
-        - Add rows only in df2 (added)
-        - Add rows with differences (modified)
-        - Add _diff_status column ("deleted", "added", "modified", "unchanged")
+        - Select rows only in df1 (deleted) and only in df2 (added)
+        - Select rows present in both from df2 (modified, plus unchanged if requested)
+        - Tag each block with _diff_status and concatenate them
         - Reset index to make keys into columns
         - Reorder columns: keys first, then _diff_status, then other columns
     """
-    result_rows = []
-
-    # Make copies to avoid modifying originals
-    df1_copy = df1.copy()
-    df2_copy = df2.copy()
-
+    # set_index and reset_index return new frames, so the originals are untouched
     if key_columns:
         # Use key columns as index
-        df1_indexed = df1_copy.set_index(key_columns)
-        df2_indexed = df2_copy.set_index(key_columns)
+        df1_indexed = df1.set_index(key_columns)
+        df2_indexed = df2.set_index(key_columns)
     else:
         # Use row position as index
-        df1_indexed = df1_copy.reset_index(drop=True)
-        df2_indexed = df2_copy.reset_index(drop=True)
-
-    # Add deleted rows (only in df1)
-    for idx in differences.only_df1:
-        row = df1_indexed.loc[idx].copy()
-        row_dict = row.to_dict()
-        if key_columns:
-            # Add key columns to dict
-            if isinstance(idx, tuple):
-                for i, col in enumerate(key_columns):
-                    row_dict[col] = idx[i]
-            else:
-                row_dict[key_columns[0]] = idx
-        row_dict["_diff_status"] = "deleted"
-        result_rows.append(row_dict)
-
-    # Add added rows (only in df2)
-    for idx in differences.only_df2:
-        row = df2_indexed.loc[idx].copy()
-        row_dict = row.to_dict()
-        if key_columns:
-            # Add key columns to dict
-            if isinstance(idx, tuple):
-                for i, col in enumerate(key_columns):
-                    row_dict[col] = idx[i]
-            else:
-                row_dict[key_columns[0]] = idx
-        row_dict["_diff_status"] = "added"
-        result_rows.append(row_dict)
-
-    # Find unchanged rows and add modified rows
-    common_indices = set(df1_indexed.index) & set(df2_indexed.index)
-    for idx in common_indices:
-        row2 = df2_indexed.loc[idx]
-
-        # Use df2 values (current state)
-        row_dict = row2.to_dict()
-        if key_columns:
-            # Add key columns to dict
-            if isinstance(idx, tuple):
-                for i, col in enumerate(key_columns):
-                    row_dict[col] = idx[i]
-            else:
-                row_dict[key_columns[0]] = idx
-
-        if idx in differences.modified_rows:
-            row_dict["_diff_status"] = "modified"
-        else:
-            row_dict["_diff_status"] = "unchanged"
-
-        result_rows.append(row_dict)
-
-    # Create result DataFrame
-    df_result = pd.DataFrame(result_rows)
+        df1_indexed = df1.reset_index(drop=True)
+        df2_indexed = df2.reset_index(drop=True)
+
+    # Deleted rows (only in df1) and added rows (only in df2)
+    deleted = df1_indexed[df1_indexed.index.isin(differences.only_df1)]
+    added = df2_indexed[df2_indexed.index.isin(differences.only_df2)]
+
+    # Rows in both frames use df2 values (current state)
+    common = df2_indexed[df2_indexed.index.isin(df1_indexed.index)]
+    is_modified = common.index.isin(differences.modified_rows)
+    if include_unchanged:
+        common = common.assign(_diff_status=np.where(is_modified, "modified", "unchanged"))
+    else:
+        common = common[is_modified].assign(_diff_status="modified")
+
+    blocks = [
+        block
+        for block in (
+            deleted.assign(_diff_status="deleted"),
+            added.assign(_diff_status="added"),
+            common,
+        )
+        if not block.empty
+    ]
 
-    if df_result.empty:
+    if not blocks:
         # Handle empty result
         if key_columns:
-            df_result = pd.DataFrame(columns=list(key_columns) + ["_diff_status"])
-        else:
-            df_result = pd.DataFrame(columns=["_diff_status"])
+            return pd.DataFrame(columns=list(key_columns) + ["_diff_status"])
+        return pd.DataFrame(columns=["_diff_status"])
+
+    # Concatenate whole blocks and turn keys back into columns
+    df_result = pd.concat(blocks)
+    df_result = df_result.reset_index(drop=not key_columns)
 
     # Reorder columns: keys first, then _diff_status, then other columns
-    if not df_result.empty:
-        other_columns = [
-            col for col in df_result.columns if col != "_diff_status" and col not in key_columns
-        ]
-        column_order = list(key_columns) + ["_diff_status"] + other_columns
-        df_result = df_result[column_order]
+    other_columns = [
+        col for col in df_result.columns if col != "_diff_status" and col not in key_columns
+    ]
+    column_order = list(key_columns) + ["_diff_status"] + other_columns
+    df_result = df_result[column_order]
 
     return df_result
 
@@ -321,7 +411,10 @@ def build_comparison_result(
 
 
 def compare_dataframes(
-    df1: pd.DataFrame, df2: pd.DataFrame, key_columns: list[str] | None = None
+    df1: pd.DataFrame,
+    df2: pd.DataFrame,
+    key_columns: list[str] | None = None,
+    include_unchanged: bool = True,
 ) -> Result[ComparisonResult, CompareError]:
     """Compare two DataFrames.
 
@@ -329,6 +422,7 @@ def compare_dataframes(
         df1: First DataFrame (before)
         df2: Second DataFrame (after)
         key_columns: Columns to use as keys (None = use row position)
+        include_unchanged: Whether df_result includes rows with no differences
 
     Returns:
         Result[ComparisonResult, CompareError] - Comparison result or error
@@ -367,7 +461,9 @@ def compare_dataframes(
 
     # Build comparison result
     try:
-        df_result = build_comparison_result(df1, df2, differences, validated_keys)
+        df_result = build_comparison_result(
+            df1, df2, differences, validated_keys, include_unchanged
+        )
     except Exception as e:
         return err(ComparisonFailedError(f"Failed to build result: {str(e)}"))
 
@@ -215,6 +215,10 @@ def apply_filter(
             return err(ColumnMismatchError(error_msg, condition))
         return err(QueryFailedError(error_msg, condition))
 
+    # Limit rows first, so column selection only copies the rows returned
+    if limit is not None:
+        df_filtered = df_filtered.head(limit)
+
     # Select columns if specified
     if columns:
         missing = [c for c in columns if c not in df_filtered.columns]
@@ -222,8 +226,4 @@ def apply_filter(
             return err(ColumnsNotFoundError(missing, list(df_filtered.columns)))
         df_filtered = df_filtered[columns]
 
-    # Limit rows if specified
-    if limit is not None:
-        df_filtered = df_filtered.head(limit)
-
     return ok(df_filtered)
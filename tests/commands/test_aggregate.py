@@ -397,6 +397,29 @@ class TestAggregateCommand:
 
         assert result.exit_code == 0
 
+    def test_aggregate_group_list_whitespace_and_duplicates(
+        self, csv_file_for_aggregate: Path, tmp_path: Path
+    ):
+        """Test group columns tolerate spaces, empty entries and repeats."""
+        output_path = tmp_path / "output.csv"
+        result = runner.invoke(
+            app,
+            [
+                "aggregate",
+                str(csv_file_for_aggregate),
+                "--group",
+                " category , ,category",
+                "--functions",
+                "value:sum",
+                "--output",
+                str(output_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+        df_result = pd.read_csv(output_path)
+        assert df_result["category"].tolist() == ["A", "B", "C"]
+
     def test_aggregate_specific_sheet(self, sales_data_for_aggregate: Path):
         """Test aggregation from specific sheet."""
         result = runner.invoke(
@@ -229,6 +229,32 @@ class TestAppendCommand:
             or output_path.exists()
         )
 
+    def test_append_mismatched_columns_aligned(
+        self, main_file: Path, mismatched_columns_file: Path, tmp_path: Path
+    ):
+        """Test extra columns are dropped and missing columns are filled with nulls."""
+        missing_file = tmp_path / "missing.xlsx"
+        pd.DataFrame({"name": ["Jack"], "id": [10]}).to_excel(missing_file, index=False)
+        output_path = tmp_path / "output.xlsx"
+
+        result = runner.invoke(
+            app,
+            [
+                "append",
+                str(main_file),
+                str(mismatched_columns_file),
+                str(missing_file),
+                "--output",
+                str(output_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+        df_result = pd.read_excel(output_path)
+        assert list(df_result.columns) == ["id", "name", "value"]
+        assert df_result["id"].tolist() == [1, 2, 3, 8, 9, 10]
+        assert pd.isna(df_result["value"].iloc[-1])
+
     def test_append_empty_main_file(self, empty_file: Path, additional_file_1: Path):
         """Test append with empty main file."""
         result = runner.invoke(app, ["append", str(empty_file), str(additional_file_1)])
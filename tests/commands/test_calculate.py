@@ -0,0 +1,116 @@
+"""Unit tests for calculate command.
+
+Tests for the calculate command that derives cumulative and growth columns.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from excel_toolkit.cli import app
+
+# Initialize CLI test runner
+runner = CliRunner()
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def sales_file(tmp_path: Path) -> Path:
+    """Create a sales file with a numeric column."""
+    df = pd.DataFrame(
+        {
+            "month": ["Jan", "Feb", "Mar", "Apr", "May"],
+            "sales": [10.0, 15.0, 20.0, 30.0, 40.0],
+        }
+    )
+    file_path = tmp_path / "sales.csv"
+    df.to_csv(file_path, index=False)
+    return file_path
+
+
+# =============================================================================
+# Calculate Command Tests
+# =============================================================================
+
+
+class TestCalculateCommand:
+    """Tests for the calculate command."""
+
+    @pytest.mark.parametrize("operation", ["cumsum", "cummean", "growth", "growth_pct", "diff"])
+    def test_calculate_operations(self, sales_file: Path, tmp_path: Path, operation: str):
+        """Test each operation matches the equivalent pandas computation."""
+        output_path = tmp_path / "output.csv"
+        result = runner.invoke(
+            app,
+            [
+                "calculate",
+                str(sales_file),
+                "--column",
+                "sales",
+                "--operation",
+                operation,
+                "--output",
+                str(output_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+        sales = pd.read_csv(sales_file)["sales"]
+        expected = {
+            "cumsum": sales.cumsum(),
+            "cummean": sales.expanding().mean(),
+            "growth": sales.diff(),
+            "growth_pct": sales.pct_change() * 100,
+            "diff": sales.diff(),
+        }[operation]
+        df_result = pd.read_csv(output_path)
+        pd.testing.assert_series_equal(df_result[f"sales_{operation}"], expected, check_names=False)
+
+    def test_calculate_cummean_with_nulls(self, tmp_path: Path):
+        """Test cummean skips nulls and stays null until the first value."""
+        file_path = tmp_path / "nulls.csv"
+        pd.DataFrame({"value": [None, 2.0, None, 4.0]}).to_csv(file_path, index=False)
+        output_path = tmp_path / "output.csv"
+
+        result = runner.invoke(
+            app,
+            [
+                "calculate",
+                str(file_path),
+                "-c",
+                "value",
+                "-op",
+                "cummean",
+                "-o",
+                str(output_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+        values = pd.read_csv(output_path)["value_cummean"].tolist()
+        assert pd.isna(values[0])
+        assert values[1:] == [2.0, 2.0, 3.0]
+
+    def test_calculate_invalid_operation(self, sales_file: Path):
+        """Test that an unknown operation is rejected."""
+        result = runner.invoke(
+            app, ["calculate", str(sales_file), "--column", "sales", "--operation", "median"]
+        )
+
+        assert result.exit_code == 1
+        assert "Invalid operation" in result.output
+
+    def test_calculate_non_numeric_column(self, sales_file: Path):
+        """Test that a non-numeric column is rejected."""
+        result = runner.invoke(
+            app, ["calculate", str(sales_file), "--column", "month", "--operation", "cumsum"]
+        )
+
+        assert result.exit_code == 1
+        assert "not numeric" in result.output
@@ -152,6 +152,20 @@ class TestCleanCommand:
         assert result.exit_code == 0
         assert "Cleaned" in result.stdout
 
+    def test_clean_keep_alphanumeric_values(self, tmp_path: Path):
+        """Test that only ASCII letters and digits are kept, including in non-ASCII text."""
+        input_path = tmp_path / "codes.csv"
+        pd.DataFrame({"code": ["AB-12 #3", "Café_7", "x.y@z"]}).to_csv(input_path, index=False)
+        output_path = tmp_path / "cleaned.csv"
+
+        result = runner.invoke(
+            app,
+            ["clean", str(input_path), "--keep-alphanumeric", "--output", str(output_path)],
+        )
+
+        assert result.exit_code == 0
+        assert pd.read_csv(output_path)["code"].tolist() == ["AB123", "Caf7", "xyz"]
+
     def test_clean_casefold(self, messy_data_file: Path):
         """Test casefold operation."""
         result = runner.invoke(
@@ -179,6 +193,30 @@ class TestCleanCommand:
         assert result.exit_code == 0
         assert "Cleaned" in result.stdout
 
+    def test_clean_multiple_operations_values(self, messy_data_file: Path, tmp_path: Path):
+        """Test that combined operations produce the expected cleaned values."""
+        output_path = tmp_path / "cleaned.xlsx"
+        result = runner.invoke(
+            app,
+            [
+                "clean",
+                str(messy_data_file),
+                "--trim",
+                "--whitespace",
+                "--titlecase",
+                "--columns",
+                "name,city",
+                "--output",
+                str(output_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+        df = pd.read_excel(output_path)
+        assert df["name"].tolist() == ["Alice", "Bob", "Charlie", "Diana", "Eve"]
+        assert df["city"].tolist() == ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"]
+        assert df["email"].iloc[1] == "  BOB@EXAMPLE.COM  "
+
     def test_clean_with_output(self, messy_data_file: Path, tmp_path: Path):
         """Test cleaning with output file."""
         output_path = tmp_path / "cleaned.xlsx"
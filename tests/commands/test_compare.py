@@ -286,6 +286,17 @@ class TestCompareCommand:
 
         assert result.exit_code == 1
 
+    @pytest.mark.parametrize("spec", [",", " ", ""])
+    def test_compare_blank_key_columns(self, baseline_file: Path, modified_file: Path, spec: str):
+        """Test that a key spec naming no columns is rejected, not compared by position."""
+        result = runner.invoke(
+            app, ["compare", str(baseline_file), str(modified_file), "--key-columns", spec]
+        )
+
+        assert result.exit_code == 1
+        assert "--key-columns must name at least one column" in result.stderr
+        assert "Modified rows" not in result.stdout
+
     def test_compare_help(self):
         """Test compare command help."""
         result = runner.invoke(app, ["compare", "--help"])
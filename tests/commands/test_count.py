@@ -186,6 +186,67 @@ class TestCountCommand:
         assert "Written to:" in result.stdout
         assert output_path.exists()
 
+    def test_count_values_most_frequent_first(self, tmp_path: Path):
+        """Test that counts skip missing values and keep ties in first-seen order."""
+        input_path = tmp_path / "ties.csv"
+        input_path.write_text("color\nred\nblue\n\ngreen\nblue\ngreen\nred\nred\n")
+        output_path = tmp_path / "counts.csv"
+
+        result = runner.invoke(
+            app, ["count", str(input_path), "--columns", "color", "--output", str(output_path)]
+        )
+
+        assert result.exit_code == 0
+        df = pd.read_csv(output_path)
+        assert df["color"].tolist() == ["red", "blue", "green"]
+        assert df["count"].tolist() == [3, 2, 2]
+
+    def test_count_unique_column_with_limit(self, sample_data_file: Path, tmp_path: Path):
+        """Test that a limited count of a unique column keeps the leading values."""
+        output_path = tmp_path / "counts.csv"
+        result = runner.invoke(
+            app,
+            [
+                "count",
+                str(sample_data_file),
+                "--columns",
+                "id",
+                "--limit",
+                "3",
+                "--output",
+                str(output_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+        df = pd.read_csv(output_path)
+        assert df["id"].tolist() == [1, 2, 3]
+        assert df["count"].tolist() == [1, 1, 1]
+
+    def test_count_sort_by_count_with_limit(self, csv_file_for_count: Path, tmp_path: Path):
+        """Test that a limited count sort keeps the most frequent values."""
+        output_path = tmp_path / "counts.csv"
+        result = runner.invoke(
+            app,
+            [
+                "count",
+                str(csv_file_for_count),
+                "--columns",
+                "product",
+                "--sort",
+                "count",
+                "--limit",
+                "2",
+                "--output",
+                str(output_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+        df = pd.read_csv(output_path)
+        assert df["product"].tolist() == ["Apple", "Banana"]
+        assert df["count"].tolist() == [3, 2]
+
     def test_count_csv_input(self, csv_file_for_count: Path):
         """Test count from CSV file."""
         result = runner.invoke(app, ["count", str(csv_file_for_count), "--columns", "product"])
@@ -217,6 +278,14 @@ class TestCountCommand:
         assert result.exit_code == 1
         assert "Columns not found" in result.stdout or "Available columns" in result.stdout
 
+    @pytest.mark.parametrize("spec", [",", " ", ""])
+    def test_count_blank_columns(self, sample_data_file: Path, spec: str):
+        """Test that a --columns spec naming no columns is rejected."""
+        result = runner.invoke(app, ["count", str(sample_data_file), "--columns", spec])
+
+        assert result.exit_code == 1
+        assert "--columns must name at least one column" in result.stderr
+
     def test_count_partial_missing_columns(self, multi_column_file: Path):
         """Test count with some valid and some invalid columns."""
         result = runner.invoke(
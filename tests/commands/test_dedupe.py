@@ -251,6 +251,14 @@ class TestDedupeCommand:
         # Error goes to stderr
         assert "Columns not found" in result.stderr or "Columns not found" in result.stdout
 
+    @pytest.mark.parametrize("spec", [",", " , "])
+    def test_dedupe_blank_by_columns(self, file_with_duplicates: Path, spec: str):
+        """Test that a --by spec naming no columns is rejected."""
+        result = runner.invoke(app, ["dedupe", str(file_with_duplicates), "--by", spec])
+
+        assert result.exit_code == 1
+        assert "--by must name at least one column" in result.stderr
+
     def test_dedupe_invalid_keep_value(self, file_with_duplicates: Path):
         """Test deduplication with invalid keep value."""
         result = runner.invoke(app, ["dedupe", str(file_with_duplicates), "--keep", "invalid"])
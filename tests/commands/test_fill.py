@@ -189,6 +189,18 @@ class TestFillCommand:
         assert result.exit_code == 0
         assert "Strategy: bfill" in result.stdout
 
+    def test_fill_ffill_with_complete_column(self, file_for_ffill_bfill: Path):
+        """Test forward fill when one of the named columns has no missing values."""
+        result = runner.invoke(
+            app,
+            ["fill", str(file_for_ffill_bfill), "--columns", "date,value", "--strategy", "ffill"],
+        )
+
+        assert result.exit_code == 0
+        assert "Missing values before: 3" in result.stdout
+        assert "Values filled: 3" in result.stdout
+        assert "Columns: date, value" in result.stdout
+
     def test_fill_multiple_columns(self, file_with_nulls: Path):
         """Test filling multiple columns."""
         result = runner.invoke(
@@ -261,6 +273,16 @@ class TestFillCommand:
 
         assert result.exit_code == 1
 
+    @pytest.mark.parametrize("spec", [",", " , "])
+    def test_fill_blank_columns(self, file_with_nulls: Path, spec: str):
+        """Test that a --columns spec naming no columns is rejected."""
+        result = runner.invoke(
+            app, ["fill", str(file_with_nulls), "--columns", spec, "--value", "0"]
+        )
+
+        assert result.exit_code == 1
+        assert "--columns must name at least one column" in result.stderr
+
     def test_fill_invalid_strategy(self, file_with_nulls: Path):
         """Test filling with invalid strategy."""
         result = runner.invoke(
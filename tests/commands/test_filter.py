@@ -212,6 +212,16 @@ class TestFilterCommand:
 
         assert result.exit_code == 1
 
+    @pytest.mark.parametrize("spec", [",", " , "])
+    def test_filter_blank_columns_param(self, sample_excel_file: Path, spec: str):
+        """Test that a --columns spec naming no columns is rejected."""
+        result = runner.invoke(
+            app, ["filter", str(sample_excel_file), "age > 25", "--columns", spec]
+        )
+
+        assert result.exit_code == 1
+        assert "--columns must name at least one column" in result.stderr
+
     def test_filter_invalid_columns_param(self, sample_excel_file: Path):
         """Test invalid columns parameter."""
         result = runner.invoke(
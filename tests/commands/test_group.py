@@ -266,6 +266,16 @@ class TestGroupCommand:
 
         assert result.exit_code == 1
 
+    @pytest.mark.parametrize("spec", [",", " "])
+    def test_group_blank_group_columns(self, sales_data_file: Path, spec: str):
+        """Test that a --by spec naming no columns is rejected."""
+        result = runner.invoke(
+            app, ["group", str(sales_data_file), "--by", spec, "--aggregate", "amount:sum"]
+        )
+
+        assert result.exit_code == 1
+        assert "--by must name at least one column" in result.stderr
+
     def test_group_invalid_aggregate_column(self, sales_data_file: Path):
         """Test grouping with non-existent aggregate column."""
         result = runner.invoke(
@@ -370,6 +370,17 @@ class TestFillMissingValues:
         assert df_filled["Name"].iloc[2] == "David"
         assert df_filled["ID"].tolist() == [1, 2, 4, 5]  # Row with ID=3 was dropped
 
+    def test_fill_leaves_original_unchanged(self, dataframe_with_missing_values):
+        """Test that filling does not modify the source DataFrame."""
+        original = dataframe_with_missing_values.copy()
+        result = fill_missing_values(
+            dataframe_with_missing_values, strategy="forward", columns=["Age", "Salary"]
+        )
+
+        assert is_ok(result)
+        assert unwrap(result)["Age"].notna().all()
+        pd.testing.assert_frame_equal(dataframe_with_missing_values, original)
+
     def test_dict_strategy_different_strategies(self, dataframe_with_missing_values):
         """Test dict strategy with different strategies per column."""
         result = fill_missing_values(
@@ -343,6 +343,17 @@ class TestFindDifferences:
         assert len(result.only_df2) == 0
         assert 2 in result.modified_rows  # Row 2 has different Name
 
+    def test_no_key_columns_different_lengths(self):
+        """Test that row positions ignore the index and split off extra rows."""
+        df1 = pd.DataFrame({"Name": ["Alice", "Bob", "Charlie"]}, index=[10, 20, 30])
+        df2 = pd.DataFrame({"Name": ["Alice", "Robert", "Charlie", "David", "Eve"]})
+
+        result = find_differences(df1, df2, [])
+
+        assert result.only_df1 == set()
+        assert result.only_df2 == {3, 4}
+        assert result.modified_rows == [1]
+
     def test_multiple_key_columns(self):
         """Test finding differences with multiple key columns."""
         df1 = pd.DataFrame(
@@ -367,6 +378,43 @@ class TestFindDifferences:
         # Modified: (1, 'Alice') second occurrence has different Value
         assert len(result.modified_rows) > 0
 
+    def test_duplicate_keys_compared_in_order(self):
+        """Test that repeated keys compare their rows occurrence by occurrence."""
+        df1 = pd.DataFrame({"ID": [1, 1, 2, 2, 3], "Value": [10, 20, 30, 40, 50]})
+        df2 = pd.DataFrame({"ID": [1, 1, 2, 3, 3], "Value": [15, 20, 30, 50, 50]})
+
+        result = find_differences(df1, df2, ["ID"])
+
+        # 1: first row changed, 2: one row fewer, 3: one row more
+        assert result.modified_rows == [1, 2, 3]
+
+    def test_unique_multiple_key_columns(self):
+        """Test deleted, added and modified composite keys in unordered frames."""
+        df1 = pd.DataFrame(
+            {"ID": [1, 1, 2, 3], "Year": [2023, 2024, 2024, 2024], "Value": [10, 20, 30, 40]}
+        )
+        df2 = pd.DataFrame(
+            {"ID": [4, 3, 2, 1], "Year": [2024, 2024, 2024, 2024], "Value": [50, 40, 35, 20]}
+        )
+
+        result = find_differences(df1, df2, ["ID", "Year"])
+
+        assert result.only_df1 == {(1, 2023)}
+        assert result.only_df2 == {(4, 2024)}
+        assert result.modified_rows == [(2, 2024)]
+
+    def test_column_order_ignored(self, dataframe1, dataframe_same):
+        """Test that reordered columns do not count as modifications."""
+        result = find_differences(dataframe1, dataframe_same[["City", "Age", "Name", "ID"]], ["ID"])
+
+        assert result.modified_rows == []
+
+    def test_different_columns_all_modified(self, dataframe1, dataframe_same):
+        """Test that every common row is modified when the column sets differ."""
+        result = find_differences(dataframe1, dataframe_same.assign(Extra=1), ["ID"])
+
+        assert sorted(result.modified_rows) == [1, 2, 3, 4, 5]
+
     def test_nan_handling(self, dataframe_with_nan, dataframe_with_nan_different):
         """Test that NaN values are handled correctly."""
         result = find_differences(dataframe_with_nan, dataframe_with_nan_different, ["ID"])
@@ -550,6 +598,18 @@ class TestCompareDataframes:
         assert "modified" in statuses
         assert "unchanged" in statuses
 
+    def test_exclude_unchanged(self, dataframe1, dataframe2):
+        """Test that include_unchanged=False leaves out unchanged rows."""
+        result = compare_dataframes(dataframe1, dataframe2, ["ID"], include_unchanged=False)
+
+        assert is_ok(result)
+        comparison = unwrap(result)
+        statuses = comparison.df_result["_diff_status"].tolist()
+        assert "unchanged" not in statuses
+        assert len(statuses) == (
+            comparison.added_count + comparison.deleted_count + comparison.modified_count
+        )
+
     def test_no_key_columns(self, dataframe1):
         """Test comparing without key columns (row position)."""
         df2 = pd.DataFrame(
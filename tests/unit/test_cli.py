@@ -0,0 +1,165 @@
+"""Unit tests for the root CLI application.
+
+Tests for the CLI entry point and lazy command registration including:
+- A single cli.py module backing the console script
+- Every lazily registered command resolving to its module
+- Lightweight commands not importing pandas
+- The root dispatcher answering informational commands without Typer
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+import excel_toolkit
+from excel_toolkit.cli import app
+from excel_toolkit.commands import COMMAND_NAMES
+
+runner = CliRunner()
+
+PACKAGE_DIR = Path(excel_toolkit.__file__).parent
+
+
+# =============================================================================
+# Entry Point Tests
+# =============================================================================
+
+
+class TestEntryPoint:
+    """Tests for the CLI entry point module."""
+
+    def test_single_cli_module(self):
+        """Test that the package ships exactly one cli.py."""
+        cli_modules = list(PACKAGE_DIR.rglob("cli.py"))
+
+        assert cli_modules == [PACKAGE_DIR / "cli.py"]
+
+    def test_console_script_points_to_cli_main(self):
+        """Test that the xl script targets excel_toolkit.cli:main."""
+        pyproject = (PACKAGE_DIR.parent / "pyproject.toml").read_text()
+
+        assert 'xl = "excel_toolkit.cli:main"' in pyproject
+
+
+# =============================================================================
+# Root Dispatcher Tests
+# =============================================================================
+
+
+def run_main(*args: str) -> subprocess.CompletedProcess:
+    """Run excel_toolkit.cli.main in a fresh interpreter and report loaded modules."""
+    code = (
+        "import sys\n"
+        f"sys.argv = ['xl', *{list(args)!r}]\n"
+        "from excel_toolkit.cli import main\n"
+        "main()\n"
+        "print('typer' in sys.modules)\n"
+    )
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=PACKAGE_DIR.parent,
+    )
+
+
+class TestRootDispatcher:
+    """Tests for the main() root dispatcher."""
+
+    def test_version_skips_typer(self):
+        """Test that xl version is answered without importing typer."""
+        result = run_main("version")
+
+        assert result.stdout.splitlines() == [
+            f"Excel CLI Toolkit v{excel_toolkit.__version__}",
+            "False",
+        ]
+
+    def test_version_flags_skip_typer(self):
+        """Test that --version and -V are answered without importing typer."""
+        for flag in ("--version", "-V"):
+            result = run_main(flag)
+
+            assert result.stdout.splitlines() == [
+                f"Excel CLI Toolkit v{excel_toolkit.__version__}",
+                "False",
+            ]
+
+    def test_sysinfo_skips_typer(self):
+        """Test that xl sysinfo is answered without importing typer."""
+        result = run_main("sysinfo")
+
+        assert f"Version: {excel_toolkit.__version__}" in result.stdout
+        assert result.stdout.splitlines()[-1] == "False"
+
+    def test_other_commands_use_typer_app(self):
+        """Test that anything else is dispatched to the Typer app."""
+        result = subprocess.run(
+            [sys.executable, "-m", "excel_toolkit", "version", "--help"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=PACKAGE_DIR.parent,
+        )
+
+        assert "Show version information" in result.stdout
+
+
+# =============================================================================
+# Lazy Command Tests
+# =============================================================================
+
+
+class TestLazyCommands:
+    """Tests for lazily loaded subcommands."""
+
+    def test_all_commands_listed_in_help(self):
+        """Test that root help lists every registered command."""
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name in COMMAND_NAMES:
+            assert name in result.stdout
+
+    def test_command_help_resolves(self):
+        """Test that a lazy command can be resolved and shows its help."""
+        result = runner.invoke(app, ["head", "--help"])
+
+        assert result.exit_code == 0
+        assert "first N rows" in result.stdout
+
+    def test_version_flag(self):
+        """Test that the Typer app also accepts --version and -V."""
+        for flag in ("--version", "-V"):
+            result = runner.invoke(app, [flag])
+
+            assert result.exit_code == 0
+            assert excel_toolkit.__version__ in result.stdout
+
+    def test_unknown_command(self):
+        """Test that an unknown command is rejected."""
+        result = runner.invoke(app, ["not-a-command"])
+
+        assert result.exit_code != 0
+
+    def test_version_does_not_import_pandas(self):
+        """Test that the version command does not load command modules."""
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from excel_toolkit.cli import app\n"
+            "CliRunner().invoke(app, ['version'])\n"
+            "print('pandas' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=PACKAGE_DIR.parent,
+        )
+
+        assert result.stdout.strip() == "False"
@@ -7,6 +7,7 @@ Tests for ExcelHandler, CSVHandler, and HandlerFactory including:
 - Factory handler selection
 """
 
+import codecs
 from pathlib import Path
 
 import pandas as pd
@@ -19,6 +20,8 @@ from excel_toolkit.core import (
     HandlerFactory,
     InvalidFileError,
     UnsupportedFormatError,
+    get_handler_factory,
+    write_delimited,
 )
 from excel_toolkit.fp import is_err, is_ok, unwrap, unwrap_err
 
@@ -371,6 +374,49 @@ class TestCSVHandler:
         content = output_path.read_text()
         assert ";" in content
 
+    def test_write_with_encoding(self, tmp_path: Path):
+        """Writing with a non-default encoding encodes the output file."""
+        handler = CSVHandler()
+        df = pd.DataFrame({"name": ["café", "naïve"]})
+        output_path = tmp_path / "latin1.csv"
+
+        result = handler.write(df, output_path, encoding="latin-1")
+
+        assert is_ok(result)
+        assert output_path.read_bytes() == "name\ncafé\nnaïve\n".encode("latin-1")
+
+    def test_write_append_mode(self, tmp_path: Path):
+        """Writing with mode="a" appends to an existing file."""
+        handler = CSVHandler()
+        output_path = tmp_path / "append.csv"
+        handler.write(pd.DataFrame({"a": [1]}), output_path)
+
+        result = handler.write(pd.DataFrame({"a": [2]}), output_path, mode="a", header=False)
+
+        assert is_ok(result)
+        assert output_path.read_text() == "a\n1\n2\n"
+
+    def test_write_with_compression(self, tmp_path: Path):
+        """Writing with compression produces a compressed file."""
+        handler = CSVHandler()
+        df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+        output_path = tmp_path / "compressed.csv"
+
+        result = handler.write(df, output_path, compression="gzip")
+
+        assert is_ok(result)
+        assert output_path.read_bytes()[:2] == b"\x1f\x8b"
+        pd.testing.assert_frame_equal(pd.read_csv(output_path, compression="gzip"), df)
+
+    def test_write_delimited_any_extension(self, tmp_path: Path):
+        """write_delimited writes delimited text regardless of file extension."""
+        df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+        output_path = tmp_path / "output.tsv"
+
+        write_delimited(df, output_path, delimiter="\t")
+
+        assert output_path.read_text() == "a\tb\n1\t3\n2\t4\n"
+
     def test_detect_encoding_utf8(self, sample_csv_file: Path):
         """Auto-detect UTF-8 encoding."""
         handler = CSVHandler()
@@ -390,6 +436,26 @@ class TestCSVHandler:
         # Should detect latin-1 or utf-8 (both work)
         assert encoding in ["utf-8", "latin-1", "iso-8859-1", "cp1252"]
 
+    def test_detect_encoding_utf8_sample_ends_mid_character(self, tmp_path: Path):
+        """Detect UTF-8 when the sampled bytes cut a multi-byte character in half."""
+        file_path = tmp_path / "utf8.csv"
+        file_path.write_bytes(b"name\n" + "é".encode() * 4096)
+        handler = CSVHandler()
+        result = handler.detect_encoding(file_path)
+
+        assert is_ok(result)
+        assert unwrap(result) == "utf-8"
+
+    def test_detect_encoding_utf8_bom(self, tmp_path: Path):
+        """Detect utf-8-sig when the file starts with a UTF-8 byte order mark."""
+        file_path = tmp_path / "bom.csv"
+        file_path.write_bytes(codecs.BOM_UTF8 + "name\ncafé\n".encode())
+        handler = CSVHandler()
+        result = handler.detect_encoding(file_path)
+
+        assert is_ok(result)
+        assert unwrap(result) == "utf-8-sig"
+
     def test_detect_encoding_nonexistent_file(self):
         """Detect encoding on non-existent file returns error."""
         handler = CSVHandler()
@@ -424,6 +490,27 @@ class TestCSVHandler:
         assert is_err(result)
         assert isinstance(unwrap_err(result), FileNotFoundError)
 
+    def test_detect_format(self, csv_with_latin1: Path, csv_with_semicolon: Path):
+        """Detect encoding and delimiter together, matching the separate methods."""
+        handler = CSVHandler()
+
+        for path in (csv_with_latin1, csv_with_semicolon):
+            result = handler.detect_format(path)
+
+            assert is_ok(result)
+            encoding = unwrap(handler.detect_encoding(path))
+            assert unwrap(result) == (encoding, unwrap(handler.detect_delimiter(path, encoding)))
+
+    def test_detect_format_first_line_longer_than_sample(self, tmp_path: Path):
+        """Detect the delimiter when the header does not fit in the sample."""
+        file_path = tmp_path / "wide.csv"
+        file_path.write_text(";".join(f"column_{i}" for i in range(2000)) + "\n1;2\n")
+        handler = CSVHandler()
+        result = handler.detect_format(file_path)
+
+        assert is_ok(result)
+        assert unwrap(result) == ("utf-8", ";")
+
 
 # =============================================================================
 # HandlerFactory Tests
@@ -532,3 +619,10 @@ class TestHandlerFactory:
 
         assert ".xlsx" in formats
         assert ".csv" in formats
+
+    def test_get_handler_factory_is_shared(self):
+        """get_handler_factory() returns the same factory on every call."""
+        factory = get_handler_factory()
+
+        assert isinstance(factory, HandlerFactory)
+        assert get_handler_factory() is factory